@@ -33,6 +33,7 @@ class Settings(BaseSettings):
     smtp_use_tls: bool = True
     smtp_use_ssl: bool = False
     smtp_timeout_seconds: int = 20
+    smtp_max_per_second: int = 10
     email_send_retries: int = 3
 
     # OpenAI
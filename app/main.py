@@ -32,7 +32,7 @@ from app.db.session import SessionLocal
 from app.db import models
 from app.services.email.service import send_login_code_email
 from app.services.payments.service import create_checkout
-from app.services.report.pdf import build_pdf
+from app.services.report.pdf import build_pdf_async
 from app.services.subscriptions.service import (
     PLAN_FEATURES,
     can_generate_report,
@@ -41,7 +41,7 @@ from app.services.subscriptions.service import (
     has_plan_access,
     upsert_subscription,
 )
-from app.services.storage.service import is_s3_ref, media_view_url, presigned_download_url, store_upload
+from app.services.storage.service import is_s3_ref, media_view_url, media_view_urls, presigned_download_url, store_upload
 
 import redis
 from rq import Queue
@@ -1027,7 +1027,7 @@ async def billing_checkout(request: Request, plan_id: str, csrf_token: str = For
     if plan_id not in {"pro", "premium"}:
         raise HTTPException(400, "Unsupported plan")
 
-    checkout = create_checkout(user.id, user.email, plan_id=plan_id)
+    checkout = await create_checkout(user.id, user.email, plan_id=plan_id)
     payment = models.Payment(
         user_id=user.id,
         provider=checkout.provider,
@@ -1159,7 +1159,7 @@ async def download_report(report_id: str, user=Depends(get_current_user), db=Dep
         raise HTTPException(404)
     if not report.file_path:
         if report.content_json:
-            pdf_bytes = build_pdf(report.content_json, user.language)
+            pdf_bytes = await build_pdf_async(report.content_json, user.language)
             return Response(
                 content=pdf_bytes,
                 media_type="application/pdf",
@@ -1178,7 +1178,7 @@ async def download_report(report_id: str, user=Depends(get_current_user), db=Dep
 
     if not os.path.isfile(report.file_path):
         if report.content_json:
-            pdf_bytes = build_pdf(report.content_json, user.language)
+            pdf_bytes = await build_pdf_async(report.content_json, user.language)
             return Response(
                 content=pdf_bytes,
                 media_type="application/pdf",
@@ -1203,7 +1203,7 @@ async def view_report(report_id: str, user=Depends(get_current_user), db=Depends
         raise HTTPException(404)
     if not report.file_path:
         if report.content_json:
-            pdf_bytes = build_pdf(report.content_json, user.language)
+            pdf_bytes = await build_pdf_async(report.content_json, user.language)
             return Response(
                 content=pdf_bytes,
                 media_type="application/pdf",
@@ -1223,7 +1223,7 @@ async def view_report(report_id: str, user=Depends(get_current_user), db=Depends
 
     if not os.path.isfile(report.file_path):
         if report.content_json:
-            pdf_bytes = build_pdf(report.content_json, user.language)
+            pdf_bytes = await build_pdf_async(report.content_json, user.language)
             return Response(
                 content=pdf_bytes,
                 media_type="application/pdf",
@@ -1257,17 +1257,23 @@ async def tutorials(request: Request, user=Depends(get_current_user), db=Depends
         .order_by(models.TutorialCategory.title.asc(), models.Tutorial.created_at.desc())
     )
     res = await db.execute(q)
-    items = []
-    for tutorial, category in res.all():
-        if has_plan_access(plan_id, _normalize_plan_id(tutorial.required_plan)):
-            items.append(
-                {
-                    "tutorial": tutorial,
-                    "category": category,
-                    "video_url": media_view_url(tutorial.video_url),
-                    "file_url": media_view_url(tutorial.file_url),
-                }
-            )
+    visible = [
+        (tutorial, category)
+        for tutorial, category in res.all()
+        if has_plan_access(plan_id, _normalize_plan_id(tutorial.required_plan))
+    ]
+    # Resolve media refs in one de-duplicated pass; tutorials often share
+    # assets and each unique S3 ref is signed only once per render.
+    urls = media_view_urls([ref for tutorial, _ in visible for ref in (tutorial.video_url, tutorial.file_url)])
+    items = [
+        {
+            "tutorial": tutorial,
+            "category": category,
+            "video_url": urls[i * 2],
+            "file_url": urls[i * 2 + 1],
+        }
+        for i, (tutorial, category) in enumerate(visible)
+    ]
     return _render(request, "tutorials.html", {"user": user, "tutorials": items, "current_plan": plan_id})
 
 
@@ -1,22 +1,108 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import smtplib
 import ssl
+import threading
 import time
-from email.message import EmailMessage
+from email.message import EmailMessage, MIMEPart
 
 from app.core.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Building a default context loads CA certs from disk; do it once — the
+# context is immutable for our purposes and safe to share across sends.
+_SSL_CTX = ssl.create_default_context()
 
-def _lang_text(lang: str, en: str, uk: str, ru: str) -> str:
-    if lang == "uk":
-        return uk
-    if lang == "ru":
-        return ru
-    return en
+
+class TokenBucket:
+    """Simple thread-safe token bucket for pacing outbound SMTP traffic.
+
+    Sending faster than the provider's per-second limit produces 454
+    throttling responses that look like failures and feed the retry loop;
+    sleeping the deficit up front is cheaper than retrying doomed sends.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = max(float(rate), 0.001)
+        self.capacity = max(float(capacity), 1.0)
+        self.tokens = self.capacity
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+            self.tokens -= n
+            deficit = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if deficit > 0:
+            time.sleep(deficit)
+
+
+_BUCKET = TokenBucket(rate=settings.smtp_max_per_second, capacity=settings.smtp_max_per_second)
+
+
+# Localized subject/body templates, resolved once at import time; only the
+# per-call str.format remains on the send path.
+_LOGIN_SUBJECT = {
+    "en": "Your BioAge login code",
+    "uk": "Ваш код входу BioAge",
+    "ru": "Ваш код входа BioAge",
+}
+_LOGIN_BODY = {
+    "en": "Your login code is: {code}\n\nIt expires in 10 minutes.",
+    "uk": "Ваш код входу: {code}\n\nВін дійсний 10 хвилин.",
+    "ru": "Ваш код входа: {code}\n\nОн действует 10 минут.",
+}
+_REPORT_SUBJECT = {
+    "en": "Your BioAge Reset Report",
+    "uk": "Ваш звіт BioAge Reset",
+    "ru": "Ваш отчет BioAge Reset",
+}
+_REPORT_BODY = {
+    "en": "Attached is your BioAge Reset Protocol report PDF.\n\nYou can also download it from your dashboard:\n{download_url}",
+    "uk": "До листа додано PDF-звіт BioAge Reset Protocol.\n\nТакож ви можете завантажити його в кабінеті:\n{download_url}",
+    "ru": "К письму приложен PDF-отчет BioAge Reset Protocol.\n\nТакже вы можете скачать его в личном кабинете:\n{download_url}",
+}
+
+
+# Base64-encoding a multi-MB PDF is O(N) per send; cache the encoded MIME
+# part so mailing the same attachment again reuses it. Keyed by content
+# digest rather than the raw bytes to avoid holding a second copy alive.
+_ATTACHMENT_CACHE: dict[tuple[str, str, str], MIMEPart] = {}
+_ATTACHMENT_CACHE_MAX = 8
+_attachment_cache_lock = threading.Lock()
+
+
+def _attachment_part(filename: str, content: bytes | str, mime: str) -> MIMEPart:
+    # content may be a filesystem path instead of bytes; then the file is
+    # only read while the part is being encoded, so callers that already
+    # wrote the attachment to disk never hold a second full copy.
+    if isinstance(content, str):
+        st = os.stat(content)
+        key = (f"{content}\x00{st.st_mtime_ns}\x00{st.st_size}", filename, mime)
+    else:
+        key = (hashlib.sha256(content).hexdigest(), filename, mime)
+    with _attachment_cache_lock:
+        part = _ATTACHMENT_CACHE.get(key)
+        if part is None:
+            if isinstance(content, str):
+                with open(content, "rb") as f:
+                    data = f.read()
+            else:
+                data = content
+            maintype, subtype = mime.split("/", 1)
+            part = MIMEPart()
+            part.set_content(data, maintype=maintype, subtype=subtype, filename=filename, disposition="attachment", cte="base64")
+            if len(_ATTACHMENT_CACHE) >= _ATTACHMENT_CACHE_MAX:
+                _ATTACHMENT_CACHE.pop(next(iter(_ATTACHMENT_CACHE)))
+            _ATTACHMENT_CACHE[key] = part
+    return part
 
 
 def _from_header() -> str:
@@ -25,10 +111,10 @@ def _from_header() -> str:
     return settings.email_from or ""
 
 
-def send_email(to_email: str, subject: str, body: str, attachment: tuple[str, bytes, str] | None = None) -> None:
+def send_email(to_email: str, subject: str, body: str, attachment: tuple[str, bytes | str, str] | None = None) -> None:
     """Send an email via SMTP with retry logic.
 
-    attachment: (filename, content_bytes, mime_type)
+    attachment: (filename, content_bytes_or_path, mime_type)
     Raises on final failure.
     """
     if not settings.smtp_host or not settings.email_from:
@@ -45,24 +131,34 @@ def send_email(to_email: str, subject: str, body: str, attachment: tuple[str, by
 
     if attachment:
         filename, content, mime = attachment
-        maintype, subtype = mime.split("/", 1)
-        msg.add_attachment(content, maintype=maintype, subtype=subtype, filename=filename)
+        msg.make_mixed()
+        msg.attach(_attachment_part(filename, content, mime))
+
+    # Hoist settings lookups out of the retry loop.
+    smtp_host = settings.smtp_host
+    smtp_port = settings.smtp_port
+    smtp_timeout = settings.smtp_timeout_seconds
+    smtp_use_ssl = settings.smtp_use_ssl
+    smtp_use_tls = settings.smtp_use_tls
+    smtp_username = settings.smtp_username
+    smtp_password = settings.smtp_password
 
     retries = max(int(settings.email_send_retries), 1)
     last_err: Exception | None = None
+    _BUCKET.acquire()
     for attempt in range(1, retries + 1):
         try:
-            if settings.smtp_use_ssl:
-                with smtplib.SMTP_SSL(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout_seconds, context=ssl.create_default_context()) as server:
-                    if settings.smtp_username and settings.smtp_password:
-                        server.login(settings.smtp_username, settings.smtp_password)
+            if smtp_use_ssl:
+                with smtplib.SMTP_SSL(smtp_host, smtp_port, timeout=smtp_timeout, context=_SSL_CTX) as server:
+                    if smtp_username and smtp_password:
+                        server.login(smtp_username, smtp_password)
                     server.send_message(msg)
             else:
-                with smtplib.SMTP(settings.smtp_host, settings.smtp_port, timeout=settings.smtp_timeout_seconds) as server:
-                    if settings.smtp_use_tls:
-                        server.starttls(context=ssl.create_default_context())
-                    if settings.smtp_username and settings.smtp_password:
-                        server.login(settings.smtp_username, settings.smtp_password)
+                with smtplib.SMTP(smtp_host, smtp_port, timeout=smtp_timeout) as server:
+                    if smtp_use_tls:
+                        server.starttls(context=_SSL_CTX)
+                    if smtp_username and smtp_password:
+                        server.login(smtp_username, smtp_password)
                     server.send_message(msg)
             return
         except Exception as e:
@@ -74,7 +170,7 @@ def send_email(to_email: str, subject: str, body: str, attachment: tuple[str, by
         raise last_err
 
 
-def safe_send_email(to_email: str, subject: str, body: str, attachment: tuple[str, bytes, str] | None = None) -> bool:
+def safe_send_email(to_email: str, subject: str, body: str, attachment: tuple[str, bytes | str, str] | None = None) -> bool:
     try:
         send_email(to_email=to_email, subject=subject, body=body, attachment=attachment)
         return True
@@ -84,40 +180,17 @@ def safe_send_email(to_email: str, subject: str, body: str, attachment: tuple[st
 
 
 def send_login_code_email(to_email: str, code: str, lang: str = "en") -> bool:
-    subject = _lang_text(
-        lang,
-        "Your BioAge login code",
-        "\u0412\u0430\u0448 \u043a\u043e\u0434 \u0432\u0445\u043e\u0434\u0443 BioAge",
-        "\u0412\u0430\u0448 \u043a\u043e\u0434 \u0432\u0445\u043e\u0434\u0430 BioAge",
-    )
-    body = _lang_text(
-        lang,
-        f"Your login code is: {code}\n\nIt expires in 10 minutes.",
-        f"\u0412\u0430\u0448 \u043a\u043e\u0434 \u0432\u0445\u043e\u0434\u0443: {code}\n\n\u0412\u0456\u043d \u0434\u0456\u0439\u0441\u043d\u0438\u0439 10 \u0445\u0432\u0438\u043b\u0438\u043d.",
-        f"\u0412\u0430\u0448 \u043a\u043e\u0434 \u0432\u0445\u043e\u0434\u0430: {code}\n\n\u041e\u043d \u0434\u0435\u0439\u0441\u0442\u0432\u0443\u0435\u0442 10 \u043c\u0438\u043d\u0443\u0442.",
-    )
+    subject = _LOGIN_SUBJECT.get(lang, _LOGIN_SUBJECT["en"])
+    body = _LOGIN_BODY.get(lang, _LOGIN_BODY["en"]).format(code=code)
     return safe_send_email(to_email=to_email, subject=subject, body=body)
 
 
 def send_report_email(
     to_email: str,
     download_url: str,
-    attachment: tuple[str, bytes, str] | None = None,
+    attachment: tuple[str, bytes | str, str] | None = None,
     lang: str = "en",
 ) -> bool:
-    subject = _lang_text(
-        lang,
-        "Your BioAge Reset Report",
-        "\u0412\u0430\u0448 \u0437\u0432\u0456\u0442 BioAge Reset",
-        "\u0412\u0430\u0448 \u043e\u0442\u0447\u0435\u0442 BioAge Reset",
-    )
-    body = _lang_text(
-        lang,
-        "Attached is your BioAge Reset Protocol report PDF.\n\n"
-        f"You can also download it from your dashboard:\n{download_url}",
-        "\u0414\u043e \u043b\u0438\u0441\u0442\u0430 \u0434\u043e\u0434\u0430\u043d\u043e PDF-\u0437\u0432\u0456\u0442 BioAge Reset Protocol.\n\n"
-        f"\u0422\u0430\u043a\u043e\u0436 \u0432\u0438 \u043c\u043e\u0436\u0435\u0442\u0435 \u0437\u0430\u0432\u0430\u043d\u0442\u0430\u0436\u0438\u0442\u0438 \u0439\u043e\u0433\u043e \u0432 \u043a\u0430\u0431\u0456\u043d\u0435\u0442\u0456:\n{download_url}",
-        "\u041a \u043f\u0438\u0441\u044c\u043c\u0443 \u043f\u0440\u0438\u043b\u043e\u0436\u0435\u043d PDF-\u043e\u0442\u0447\u0435\u0442 BioAge Reset Protocol.\n\n"
-        f"\u0422\u0430\u043a\u0436\u0435 \u0432\u044b \u043c\u043e\u0436\u0435\u0442\u0435 \u0441\u043a\u0430\u0447\u0430\u0442\u044c \u0435\u0433\u043e \u0432 \u043b\u0438\u0447\u043d\u043e\u043c \u043a\u0430\u0431\u0438\u043d\u0435\u0442\u0435:\n{download_url}",
-    )
+    subject = _REPORT_SUBJECT.get(lang, _REPORT_SUBJECT["en"])
+    body = _REPORT_BODY.get(lang, _REPORT_BODY["en"]).format(download_url=download_url)
     return safe_send_email(to_email=to_email, subject=subject, body=body, attachment=attachment)
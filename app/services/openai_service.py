@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 import json
 import re
 from datetime import datetime, timezone
@@ -9,6 +10,28 @@ from app.core.questions import QUESTIONS
 from app.core.settings import settings
 
 
+_client: Any | None = None
+_aclient: Any | None = None
+
+
+def _get_client() -> Any:
+    global _client
+    if _client is None:
+        from openai import OpenAI
+
+        _client = OpenAI(api_key=settings.openai_api_key)
+    return _client
+
+
+def _get_async_client() -> Any:
+    global _aclient
+    if _aclient is None:
+        from openai import AsyncOpenAI
+
+        _aclient = AsyncOpenAI(api_key=settings.openai_api_key)
+    return _aclient
+
+
 def _local(lang: str, en: str, uk: str, ru: str) -> str:
     if lang == "uk":
         return uk
@@ -25,7 +48,7 @@ def _json_text(data: Any) -> str:
 
 
 def _has_cyrillic(text: str) -> bool:
-    return bool(re.search(r"[\u0400-\u04FF]", text))
+    return bool(re.search(r"[Ѐ-ӿ]", text))
 
 
 def _is_wrong_language(data: dict[str, Any], lang: str) -> bool:
@@ -37,17 +60,35 @@ def _is_wrong_language(data: dict[str, Any], lang: str) -> bool:
     return not _has_cyrillic(text)
 
 
-def _translate_report_json(client: Any, data: dict[str, Any], lang: str, schema: dict[str, Any]) -> dict[str, Any] | None:
-    prompt = (
+def _translate_prompt(data: dict[str, Any], lang: str) -> str:
+    return (
         "Translate all string values in this JSON to language code "
         + lang
         + ". Keep structure, keys, arrays, and numeric values unchanged. Return JSON only.\n\n"
         + _json_text(data)
     )
+
+
+def _translate_report_json(client: Any, data: dict[str, Any], lang: str, schema: dict[str, Any]) -> dict[str, Any] | None:
     try:
         resp = client.responses.create(
             model=settings.openai_model,
-            input=[{"role": "user", "content": prompt}],
+            input=[{"role": "user", "content": _translate_prompt(data, lang)}],
+            response_format={"type": "json_schema", "json_schema": {"name": "bioage_report_translated", "schema": schema}},
+        )
+        out = json.loads(resp.output_text)
+        if isinstance(out, dict):
+            return out
+    except Exception:
+        pass
+    return None
+
+
+async def _translate_report_json_async(client: Any, data: dict[str, Any], lang: str, schema: dict[str, Any]) -> dict[str, Any] | None:
+    try:
+        resp = await client.responses.create(
+            model=settings.openai_model,
+            input=[{"role": "user", "content": _translate_prompt(data, lang)}],
             response_format={"type": "json_schema", "json_schema": {"name": "bioage_report_translated", "schema": schema}},
         )
         out = json.loads(resp.output_text)
@@ -104,28 +145,21 @@ def _assessment_context(answers: dict[str, Any], lang: str) -> dict[str, Any]:
     }
 
 
-def _mock_report(answers: dict[str, Any], lang: str) -> dict[str, Any]:
-    ctx = _assessment_context(answers, lang)
+def _build_mock_base(lang: str) -> dict[str, Any]:
     return {
         "title": _local(
             lang,
             "BioAge Reset Protocol - 90-Day Plan",
-            "BioAge Reset Protocol - 90-\u0434\u0435\u043d\u043d\u0438\u0439 \u043f\u043b\u0430\u043d",
-            "BioAge Reset Protocol - 90-\u0434\u043d\u0435\u0432\u043d\u044b\u0439 \u043f\u043b\u0430\u043d",
+            "BioAge Reset Protocol - 90-денний план",
+            "BioAge Reset Protocol - 90-дневный план",
         ),
-        "generated_at_utc": ctx["generated_at_utc"],
         "language": lang,
         "disclaimer": _local(
             lang,
             "This report is educational and not medical advice.",
-            "\u0426\u0435\u0439 \u0437\u0432\u0456\u0442 \u043c\u0430\u0454 \u043e\u0441\u0432\u0456\u0442\u043d\u0456\u0439 \u0445\u0430\u0440\u0430\u043a\u0442\u0435\u0440 \u0456 \u043d\u0435 \u0454 \u043c\u0435\u0434\u0438\u0447\u043d\u043e\u044e \u043f\u043e\u0440\u0430\u0434\u043e\u044e.",
-            "\u042d\u0442\u043e\u0442 \u043e\u0442\u0447\u0435\u0442 \u0438\u043c\u0435\u0435\u0442 \u043e\u0431\u0440\u0430\u0437\u043e\u0432\u0430\u0442\u0435\u043b\u044c\u043d\u044b\u0439 \u0445\u0430\u0440\u0430\u043a\u0442\u0435\u0440 \u0438 \u043d\u0435 \u044f\u0432\u043b\u044f\u0435\u0442\u0441\u044f \u043c\u0435\u0434\u0438\u0446\u0438\u043d\u0441\u043a\u043e\u0439 \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u0430\u0446\u0438\u0435\u0439.",
+            "Цей звіт має освітній характер і не є медичною порадою.",
+            "Этот отчет имеет образовательный характер и не является медицинской рекомендацией.",
         ),
-        "profile": {
-            "goal": str(answers.get("goal", "")).strip()
-            or _local(lang, "Improve health markers and consistency", "\u041f\u043e\u043a\u0440\u0430\u0449\u0438\u0442\u0438 \u043f\u043e\u043a\u0430\u0437\u043d\u0438\u043a\u0438 \u0437\u0434\u043e\u0440\u043e\u0432'\u044f \u0456 \u0441\u0442\u0430\u0431\u0456\u043b\u044c\u043d\u0456\u0441\u0442\u044c", "\u0423\u043b\u0443\u0447\u0448\u0438\u0442\u044c \u043f\u043e\u043a\u0430\u0437\u0430\u0442\u0435\u043b\u0438 \u0437\u0434\u043e\u0440\u043e\u0432\u044c\u044f \u0438 \u0441\u0442\u0430\u0431\u0438\u043b\u044c\u043d\u043e\u0441\u0442\u044c"),
-            "derived_metrics": ctx["derived_metrics"],
-        },
         "executive_summary": [
             "Focus on sleep regularity, strength training consistency, and nutrition quality.",
             "Keep stress under control with a daily recovery routine.",
@@ -172,18 +206,143 @@ def _mock_report(answers: dict[str, Any], lang: str) -> dict[str, Any]:
                 "recovery": ["Stress-management consistency", "Recovery audit"],
             },
         ],
-        "answers": answers,
         "next_steps": [
             _local(
                 lang,
                 "Repeat assessment in 30 days and compare trends.",
-                "\u041f\u043e\u0432\u0442\u043e\u0440\u0456\u0442\u044c \u043e\u0446\u0456\u043d\u043a\u0443 \u0447\u0435\u0440\u0435\u0437 30 \u0434\u043d\u0456\u0432 \u0456 \u043f\u043e\u0440\u0456\u0432\u043d\u044f\u0439\u0442\u0435 \u0434\u0438\u043d\u0430\u043c\u0456\u043a\u0443.",
-                "\u041f\u043e\u0432\u0442\u043e\u0440\u0438\u0442\u0435 \u043e\u0446\u0435\u043d\u043a\u0443 \u0447\u0435\u0440\u0435\u0437 30 \u0434\u043d\u0435\u0439 \u0438 \u0441\u0440\u0430\u0432\u043d\u0438\u0442\u0435 \u0434\u0438\u043d\u0430\u043c\u0438\u043a\u0443.",
+                "Повторіть оцінку через 30 днів і порівняйте динаміку.",
+                "Повторите оценку через 30 дней и сравните динамику.",
             )
         ],
     }
 
 
+# Everything the answers don't influence is precomputed at import time;
+# _mock_report only fills in the per-request fields.
+_MOCK_BASES: dict[str, dict[str, Any]] = {lang: _build_mock_base(lang) for lang in ("en", "uk", "ru")}
+
+_MOCK_DEFAULT_GOAL: dict[str, str] = {
+    "en": "Improve health markers and consistency",
+    "uk": "Покращити показники здоров'я і стабільність",
+    "ru": "Улучшить показатели здоровья и стабильность",
+}
+
+
+def _mock_report(answers: dict[str, Any], lang: str) -> dict[str, Any]:
+    ctx = _assessment_context(answers, lang)
+    # Deep copy: the report is stored in content_json and handed to
+    # arbitrary consumers, so its nested lists/dicts must not alias the
+    # shared base. The base is tiny, so the copy is cheap.
+    out = copy.deepcopy(_MOCK_BASES.get(lang, _MOCK_BASES["en"]))
+    out["generated_at_utc"] = ctx["generated_at_utc"]
+    out["profile"] = {
+        "goal": str(answers.get("goal", "")).strip() or _MOCK_DEFAULT_GOAL.get(lang, _MOCK_DEFAULT_GOAL["en"]),
+        "derived_metrics": ctx["derived_metrics"],
+    }
+    out["answers"] = answers
+    return out
+
+
+_REPORT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "generated_at_utc": {"type": "string"},
+        "language": {"type": "string"},
+        "disclaimer": {"type": "string"},
+        "profile": {
+            "type": "object",
+            "properties": {
+                "goal": {"type": "string"},
+                "derived_metrics": {"type": "object"},
+            },
+            "required": ["goal", "derived_metrics"],
+        },
+        "executive_summary": {"type": "array", "items": {"type": "string"}},
+        "priority_actions": {"type": "array", "items": {"type": "string"}},
+        "risk_flags": {"type": "array", "items": {"type": "string"}},
+        "summary": {
+            "type": "object",
+            "properties": {
+                "bioage_estimate": {"type": "string"},
+                "key_focus": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["bioage_estimate", "key_focus"],
+        },
+        "plan_90_days": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "week": {"type": "integer"},
+                    "focus": {"type": "string"},
+                    "actions": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["week", "focus", "actions"],
+            },
+        },
+        "phases": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "objective": {"type": "string"},
+                    "habits": {"type": "array", "items": {"type": "string"}},
+                    "training": {"type": "array", "items": {"type": "string"}},
+                    "nutrition": {"type": "array", "items": {"type": "string"}},
+                    "recovery": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["name", "objective", "habits", "training", "nutrition", "recovery"],
+            },
+        },
+        "warnings": {"type": "array", "items": {"type": "string"}},
+        "next_steps": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["title", "generated_at_utc", "language", "disclaimer", "summary", "plan_90_days"],
+}
+
+
+_STATIC_INSTRUCTIONS = (
+    "You are a founder-level longevity coach creating a practical educational report.\n"
+    "Hard requirements:\n"
+    "1) Return valid JSON only.\n"
+    "2) Language must be exactly: {lang}. Every string value must be written in that language.\n"
+    "3) Be specific and actionable, but non-diagnostic and non-prescriptive.\n"
+    "4) Keep tone clinical, concise, and structured.\n"
+    "5) Use the user's goals and metrics to personalize priorities."
+)
+
+
+def _report_messages(ctx: dict[str, Any], lang: str) -> list[dict[str, str]]:
+    # Serialize ctx once; the schema is enforced via response_format, so it
+    # never needs to be embedded in the prompt text.
+    return [
+        {"role": "system", "content": _STATIC_INSTRUCTIONS.format(lang=lang)},
+        {"role": "user", "content": "Assessment context (JSON):\n" + json.dumps(ctx, ensure_ascii=False)},
+    ]
+
+
+def _normalize_report(data: Any, answers: dict[str, Any], ctx: dict[str, Any], lang: str) -> dict[str, Any] | None:
+    # basic validation
+    if not isinstance(data, dict) or "plan_90_days" not in data:
+        return None
+    data.setdefault("language", lang)
+    data.setdefault("generated_at_utc", ctx["generated_at_utc"])
+    data.setdefault("title", "BioAge Reset Protocol - 90-Day Plan")
+    data.setdefault("profile", {"goal": str(answers.get("goal", "")), "derived_metrics": ctx["derived_metrics"]})
+    data.setdefault("executive_summary", [])
+    data.setdefault("priority_actions", [])
+    data.setdefault("risk_flags", [])
+    data.setdefault("phases", [])
+    data.setdefault("next_steps", [])
+    if not isinstance(data.get("summary"), dict):
+        data["summary"] = {"bioage_estimate": "N/A", "key_focus": []}
+    if not isinstance(data.get("plan_90_days"), list):
+        data["plan_90_days"] = []
+    return data
+
+
 def generate_report_json(answers: dict[str, Any], lang: str) -> dict[str, Any]:
     """Generate structured JSON for the PDF.
 
@@ -194,124 +353,85 @@ def generate_report_json(answers: dict[str, Any], lang: str) -> dict[str, Any]:
         return _mock_report(answers, lang)
 
     try:
-        from openai import OpenAI
-
-        client = OpenAI(api_key=settings.openai_api_key)
+        client = _get_client()
 
         ctx = _assessment_context(answers, lang)
-
-        schema = {
-            "type": "object",
-            "properties": {
-                "title": {"type": "string"},
-                "generated_at_utc": {"type": "string"},
-                "language": {"type": "string"},
-                "disclaimer": {"type": "string"},
-                "profile": {
-                    "type": "object",
-                    "properties": {
-                        "goal": {"type": "string"},
-                        "derived_metrics": {"type": "object"},
-                    },
-                    "required": ["goal", "derived_metrics"],
-                },
-                "executive_summary": {"type": "array", "items": {"type": "string"}},
-                "priority_actions": {"type": "array", "items": {"type": "string"}},
-                "risk_flags": {"type": "array", "items": {"type": "string"}},
-                "summary": {
-                    "type": "object",
-                    "properties": {
-                        "bioage_estimate": {"type": "string"},
-                        "key_focus": {"type": "array", "items": {"type": "string"}},
-                    },
-                    "required": ["bioage_estimate", "key_focus"],
-                },
-                "plan_90_days": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "week": {"type": "integer"},
-                            "focus": {"type": "string"},
-                            "actions": {"type": "array", "items": {"type": "string"}},
-                        },
-                        "required": ["week", "focus", "actions"],
-                    },
-                },
-                "phases": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "name": {"type": "string"},
-                            "objective": {"type": "string"},
-                            "habits": {"type": "array", "items": {"type": "string"}},
-                            "training": {"type": "array", "items": {"type": "string"}},
-                            "nutrition": {"type": "array", "items": {"type": "string"}},
-                            "recovery": {"type": "array", "items": {"type": "string"}},
-                        },
-                        "required": ["name", "objective", "habits", "training", "nutrition", "recovery"],
-                    },
-                },
-                "warnings": {"type": "array", "items": {"type": "string"}},
-                "next_steps": {"type": "array", "items": {"type": "string"}},
-            },
-            "required": ["title", "generated_at_utc", "language", "disclaimer", "summary", "plan_90_days"],
-        }
-
-        prompt = (
-            "You are a founder-level longevity coach creating a practical educational report.\n"
-            "Hard requirements:\n"
-            "1) Return valid JSON only.\n"
-            "2) Language must be exactly: " + lang + ".\n"
-            "3) Be specific and actionable, but non-diagnostic and non-prescriptive.\n"
-            "4) Keep tone clinical, concise, and structured.\n"
-            "5) Use the user's goals and metrics to personalize priorities.\n\n"
-            "Assessment context (JSON):\n" + json.dumps(ctx, ensure_ascii=False)
-        )
+        messages = _report_messages(ctx, lang)
 
         # Use Responses API if available; fall back to chat.
         try:
             resp = client.responses.create(
                 model=settings.openai_model,
-                input=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_schema", "json_schema": {"name": "bioage_report", "schema": schema}},
+                input=messages,
+                response_format={"type": "json_schema", "json_schema": {"name": "bioage_report", "schema": _REPORT_SCHEMA}},
             )
             text = resp.output_text
         except Exception:
             chat = client.chat.completions.create(
                 model=settings.openai_model,
-                messages=[
-                    {"role": "system", "content": "Return JSON only."},
-                    {"role": "user", "content": prompt + "\n\nJSON schema:\n" + json.dumps(schema)},
-                ],
+                messages=messages,
+                response_format={"type": "json_schema", "json_schema": {"name": "bioage_report", "schema": _REPORT_SCHEMA}},
+                temperature=0.2,
+            )
+            text = chat.choices[0].message.content or "{}"
+
+        data = _normalize_report(json.loads(text), answers, ctx, lang)
+        if data is None:
+            return _mock_report(answers, lang)
+        # For RU/UK, translate only if the model ignored the target language.
+        if lang in {"uk", "ru"} and _is_wrong_language(data, lang):
+            translated = _translate_report_json(client, data, lang, _REPORT_SCHEMA)
+            if isinstance(translated, dict) and not _is_wrong_language(translated, lang):
+                data = translated
+            else:
+                # Fallback to deterministic localized report if model ignored target language.
+                return _mock_report(answers, lang)
+        return data
+    except Exception:
+        return _mock_report(answers, lang)
+
+
+async def generate_report_json_async(answers: dict[str, Any], lang: str) -> dict[str, Any]:
+    """Async variant of generate_report_json for use inside the event loop.
+
+    Awaits the OpenAI round-trip instead of parking the calling thread.
+    """
+
+    if not settings.openai_api_key:
+        return _mock_report(answers, lang)
+
+    try:
+        client = _get_async_client()
+
+        ctx = _assessment_context(answers, lang)
+        messages = _report_messages(ctx, lang)
+
+        # Use Responses API if available; fall back to chat.
+        try:
+            resp = await client.responses.create(
+                model=settings.openai_model,
+                input=messages,
+                response_format={"type": "json_schema", "json_schema": {"name": "bioage_report", "schema": _REPORT_SCHEMA}},
+            )
+            text = resp.output_text
+        except Exception:
+            chat = await client.chat.completions.create(
+                model=settings.openai_model,
+                messages=messages,
+                response_format={"type": "json_schema", "json_schema": {"name": "bioage_report", "schema": _REPORT_SCHEMA}},
                 temperature=0.2,
             )
             text = chat.choices[0].message.content or "{}"
 
-        data = json.loads(text)
-        # basic validation
-        if not isinstance(data, dict) or "plan_90_days" not in data:
+        data = _normalize_report(json.loads(text), answers, ctx, lang)
+        if data is None:
             return _mock_report(answers, lang)
-        data.setdefault("language", lang)
-        data.setdefault("generated_at_utc", ctx["generated_at_utc"])
-        data.setdefault("title", "BioAge Reset Protocol - 90-Day Plan")
-        data.setdefault("profile", {"goal": str(answers.get("goal", "")), "derived_metrics": ctx["derived_metrics"]})
-        data.setdefault("executive_summary", [])
-        data.setdefault("priority_actions", [])
-        data.setdefault("risk_flags", [])
-        data.setdefault("phases", [])
-        data.setdefault("next_steps", [])
-        if not isinstance(data.get("summary"), dict):
-            data["summary"] = {"bioage_estimate": "N/A", "key_focus": []}
-        if not isinstance(data.get("plan_90_days"), list):
-            data["plan_90_days"] = []
-        # For RU/UK, force a translation pass to avoid partial English blocks.
-        if lang in {"uk", "ru"}:
-            translated = _translate_report_json(client, data, lang, schema)
-            if isinstance(translated, dict):
+        # For RU/UK, translate only if the model ignored the target language.
+        if lang in {"uk", "ru"} and _is_wrong_language(data, lang):
+            translated = await _translate_report_json_async(client, data, lang, _REPORT_SCHEMA)
+            if isinstance(translated, dict) and not _is_wrong_language(translated, lang):
                 data = translated
-            if _is_wrong_language(data, lang):
+            else:
                 # Fallback to deterministic localized report if model ignored target language.
                 return _mock_report(answers, lang)
         return data
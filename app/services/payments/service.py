@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
+import stripe
+
 from app.core.settings import settings
 
+# Configure the module-level client once so stripe-python's default
+# HTTPClient (urllib3 with keep-alive pooling) is reused across checkouts
+# instead of being rebuilt per call.
+if settings.stripe_secret_key:
+    stripe.api_key = settings.stripe_secret_key
+
+_SUCCESS_URL = f"{settings.base_url}/dashboard?paid=1"
+_CANCEL_URL = f"{settings.base_url}/pricing?canceled=1"
+
 
 @dataclass
 class CheckoutResult:
@@ -19,7 +31,18 @@ def _stripe_price_for_plan(plan_id: str) -> str:
     return ""
 
 
-def create_checkout(user_id: str, email: str, plan_id: str) -> CheckoutResult:
+def _create_stripe_session(email: str, user_id: str, plan_id: str, stripe_price: str) -> stripe.checkout.Session:
+    return stripe.checkout.Session.create(
+        mode="subscription",
+        customer_email=email,
+        line_items=[{"price": stripe_price, "quantity": 1}],
+        success_url=_SUCCESS_URL,
+        cancel_url=_CANCEL_URL,
+        metadata={"user_id": user_id, "plan_id": plan_id},
+    )
+
+
+async def create_checkout(user_id: str, email: str, plan_id: str) -> CheckoutResult:
     if plan_id not in {"pro", "premium"}:
         raise RuntimeError("Unsupported paid plan")
 
@@ -27,18 +50,9 @@ def create_checkout(user_id: str, email: str, plan_id: str) -> CheckoutResult:
         stripe_price = _stripe_price_for_plan(plan_id)
         if not settings.stripe_secret_key or not stripe_price:
             raise RuntimeError("Stripe is enabled but plan price ID is missing")
-        import stripe
-
-        stripe.api_key = settings.stripe_secret_key
-
-        session = stripe.checkout.Session.create(
-            mode="subscription",
-            customer_email=email,
-            line_items=[{"price": stripe_price, "quantity": 1}],
-            success_url=f"{settings.base_url}/dashboard?paid=1",
-            cancel_url=f"{settings.base_url}/pricing?canceled=1",
-            metadata={"user_id": user_id, "plan_id": plan_id},
-        )
+
+        # Run the blocking HTTPS call off the event loop.
+        session = await asyncio.to_thread(_create_stripe_session, email, user_id, plan_id, stripe_price)
         return CheckoutResult(provider="stripe", url=session.url)
 
     # mock
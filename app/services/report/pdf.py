@@ -1,19 +1,49 @@
 from __future__ import annotations
 
-from io import BytesIO
+import asyncio
+import copy
+import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import os
+import re
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+from xml.sax.saxutils import escape as _xml_escape
 
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import mm
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.platypus import (
+    KeepTogether,
+    ListFlowable,
+    ListItem,
+    LongTable,
+    PageBreak,
+    Paragraph,
+    SimpleDocTemplate,
+    Spacer,
+    Table,
+    TableStyle,
+)
 from app.core.questions import QUESTIONS
 
+# Shape checking validates every drawable on construction; skip it outside
+# of explicit debugging runs.
+if os.environ.get("BIOAGE_PDF_DEBUG") != "1":
+    rl_config.shapeChecking = 0
+
+# Deflate content streams (text-heavy pages shrink several-fold, so the
+# bytes we ship over HTTP and store in S3 are much smaller) and drop the
+# embedded timestamps so identical input yields byte-identical output.
+rl_config.pageCompression = 1
+rl_config.invariant = 1
+
 
 _L10N: dict[str, dict[str, str]] = {
     "en": {
@@ -115,12 +145,32 @@ _L10N: dict[str, dict[str, str]] = {
 }
 
 
+# Flattened at import with the English fallback pre-merged, so _t is a
+# single dict lookup instead of chained .get calls per label. Interned key
+# parts let the lookup win on pointer comparison before falling back to
+# hash+eq.
+_L10N_FLAT: dict[tuple[str, str], str] = {
+    (sys.intern(lang), sys.intern(k)): v for lang, d in _L10N.items() for k, v in {**_L10N["en"], **d}.items()
+}
+
+_METRIC_KEYS = tuple(sys.intern(k) for k in ("age", "height_cm", "weight_kg", "bmi", "sleep_hours", "stress_1_10"))
+
+
+@lru_cache(maxsize=512)
 def _t(lang: str, key: str) -> str:
-    base = _L10N.get(lang, _L10N["en"])
-    return base.get(key, _L10N["en"].get(key, key))
+    # Saturates at (#langs x #keys) entries; repeat lookups skip even the
+    # tuple-key dict chain.
+    return _L10N_FLAT.get((lang, key)) or _L10N_FLAT.get(("en", key), key)
 
 
+@lru_cache(maxsize=1)
 def _register_unicode_fonts() -> tuple[str, str]:
+    # Cached: the filesystem scan and registration only ever need to run
+    # once per process, and every build afterwards reuses the result.
+    registered = pdfmetrics.getRegisteredFontNames()
+    if "BioAgeUnicode" in registered and "BioAgeUnicodeBold" in registered:
+        return "BioAgeUnicode", "BioAgeUnicodeBold"
+
     preferred_pairs = [
         ("DejaVuSans.ttf", "DejaVuSans-Bold.ttf"),
         ("NotoSans-Regular.ttf", "NotoSans-Bold.ttf"),
@@ -133,20 +183,21 @@ def _register_unicode_fonts() -> tuple[str, str]:
         Path("C:/Windows/Fonts"),
     ]
 
+    # Walk each existing root once and index by filename; the old per-name
+    # rglob re-traversed the whole font tree for every candidate.
+    index: dict[str, str] = {}
+    for root in search_roots:
+        if not root.exists():
+            continue
+        try:
+            for dirpath, _dirnames, filenames in os.walk(root):
+                for f in filenames:
+                    index.setdefault(f, os.path.join(dirpath, f))
+        except Exception:
+            continue
+
     def find_font(name: str) -> str:
-        for root in search_roots:
-            if not root.exists():
-                continue
-            direct = root / name
-            if direct.is_file():
-                return str(direct)
-            try:
-                for path in root.rglob(name):
-                    if path.is_file():
-                        return str(path)
-            except Exception:
-                continue
-        return ""
+        return index.get(name, "")
 
     regular = ""
     bold = ""
@@ -156,21 +207,90 @@ def _register_unicode_fonts() -> tuple[str, str]:
         if regular and bold:
             break
     if regular and bold:
-        if "BioAgeUnicode" not in pdfmetrics.getRegisteredFontNames():
-            pdfmetrics.registerFont(TTFont("BioAgeUnicode", regular))
-        if "BioAgeUnicodeBold" not in pdfmetrics.getRegisteredFontNames():
-            pdfmetrics.registerFont(TTFont("BioAgeUnicodeBold", bold))
+        pdfmetrics.registerFont(TTFont("BioAgeUnicode", regular))
+        pdfmetrics.registerFont(TTFont("BioAgeUnicodeBold", bold))
         print(f"[report-pdf] Unicode fonts: regular={regular} bold={bold}")
         return "BioAgeUnicode", "BioAgeUnicodeBold"
     print("[report-pdf] Unicode fonts not found, falling back to Helvetica")
     return "Helvetica", "Helvetica-Bold"
 
 
+@lru_cache(maxsize=1)
+def _doc_prototype() -> SimpleDocTemplate:
+    """Page geometry and metadata are fixed, so the template is constructed
+    once and shallow-copied per request instead of re-running __init__."""
+    return SimpleDocTemplate(
+        None,
+        pagesize=A4,
+        title="BioAge Reset Report",
+        leftMargin=18 * mm,
+        rightMargin=18 * mm,
+        topMargin=18 * mm,
+        bottomMargin=16 * mm,
+        pageCompression=1,
+    )
+
+
+def _new_doc(buf: Any) -> SimpleDocTemplate:
+    doc = copy.copy(_doc_prototype())
+    doc.filename = buf
+    # build() appends page templates; give each clone its own list so the
+    # prototype stays pristine.
+    doc.pageTemplates = []
+    return doc
+
+
+class _ChunkBuf:
+    """Append-only write target for SimpleDocTemplate.
+
+    Collects fragments in a list and joins once in getvalue(), avoiding the
+    repeated reallocation/copy chain a growing BytesIO incurs. ReportLab only
+    appends while saving, so seeking is supported just far enough to satisfy
+    file-like expectations (tell and no-op seeks to the current end).
+    """
+
+    __slots__ = ("_chunks", "_pos")
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def write(self, data: Any) -> int:
+        b = bytes(data)
+        self._chunks.append(b)
+        self._pos += len(b)
+        return len(b)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = 0) -> int:
+        if whence == 2 and pos == 0:
+            return self._pos
+        if whence == 0 and pos == self._pos:
+            return self._pos
+        raise OSError("ChunkBuf only supports seeking to the current end")
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> bytes:
+        if len(self._chunks) > 1:
+            self._chunks = [b"".join(self._chunks)]
+        return self._chunks[0] if self._chunks else b""
+
+
+_COMMA_DOT = str.maketrans(",", ".")
+
+
 def _to_float(value: Any) -> float | None:
+    if value is None:
+        return None
+    # Numeric answers are the common case; skip the str round-trip for them.
+    if isinstance(value, (int, float)):
+        return float(value)
     try:
-        if value is None:
-            return None
-        return float(str(value).replace(",", ".").strip())
+        return float(str(value).translate(_COMMA_DOT).strip())
     except Exception:
         return None
 
@@ -182,75 +302,163 @@ def _clamp(v: int, lo: int = 0, hi: int = 100) -> int:
 def _safe_lines(values: list[Any] | None) -> str:
     if not values:
         return "-"
-    parts = [str(v).strip() for v in values if str(v).strip()]
-    return "<br/>".join(f"- {p}" for p in parts) if parts else "-"
+    joined = "<br/>".join(f"- {_xml_escape(s)}" for v in values if (s := str(v).strip()))
+    return joined or "-"
+
+
+# Localized score notes hoisted out of _compute_section_scores: indexing a
+# per-language dict once replaces the branch-per-string loc() closure.
+_SCORE_STRINGS: dict[str, dict[str, str]] = {
+    "en": {
+        "sleep_no_data": "No sleep data.",
+        "sleep_ok": "Sleep duration is in target range.",
+        "sleep_acceptable": "Sleep is acceptable but can be optimized.",
+        "sleep_short": "Sleep appears short; increase consistency.",
+        "sleep_limits_recovery": "Sleep duration likely limits recovery.",
+        "training_limited": "Training details are limited.",
+        "training_strong": "Training frequency appears strong.",
+        "training_moderate": "Moderate activity; progression recommended.",
+        "training_unstructured": "Activity exists but structure can improve.",
+        "nutrition_default": "Nutrition pattern needs consistency.",
+        "nutrition_supportive": "Nutrition style looks supportive.",
+        "nutrition_keto": "Structured approach; monitor adherence and recovery.",
+        "alcohol_frequent": "Frequent alcohol can reduce recovery quality.",
+        "recovery_default": "Stress management should be monitored.",
+        "stress_low": "Low stress profile supports recovery.",
+        "stress_moderate": "Moderate stress; maintain recovery routines.",
+        "stress_elevated": "Elevated stress; add daily down-regulation.",
+        "stress_high": "High stress likely affects progress.",
+        "risk_default": "No major lifestyle risk marker detected.",
+        "risk_smoking_sometimes": "Smoking risk is present; reduction advised.",
+        "risk_smoking_yes": "Smoking is a high-priority risk factor.",
+    },
+    "uk": {
+        "sleep_no_data": "\u041d\u0435\u043c\u0430\u0454 \u0434\u0430\u043d\u0438\u0445 \u043f\u0440\u043e \u0441\u043e\u043d.",
+        "sleep_ok": "\u0422\u0440\u0438\u0432\u0430\u043b\u0456\u0441\u0442\u044c \u0441\u043d\u0443 \u0432 \u0446\u0456\u043b\u044c\u043e\u0432\u043e\u043c\u0443 \u0434\u0456\u0430\u043f\u0430\u0437\u043e\u043d\u0456.",
+        "sleep_acceptable": "\u0421\u043e\u043d \u043f\u0440\u0438\u0439\u043d\u044f\u0442\u043d\u0438\u0439, \u0430\u043b\u0435 \u0454 \u043f\u043e\u0442\u0435\u043d\u0446\u0456\u0430\u043b \u0434\u043b\u044f \u043f\u043e\u043a\u0440\u0430\u0449\u0435\u043d\u043d\u044f.",
+        "sleep_short": "\u0421\u043e\u043d \u0432\u0438\u0433\u043b\u044f\u0434\u0430\u0454 \u043a\u043e\u0440\u043e\u0442\u043a\u0438\u043c; \u043f\u0456\u0434\u0432\u0438\u0449\u0456\u0442\u044c \u0441\u0442\u0430\u0431\u0456\u043b\u044c\u043d\u0456\u0441\u0442\u044c.",
+        "sleep_limits_recovery": "\u0422\u0440\u0438\u0432\u0430\u043b\u0456\u0441\u0442\u044c \u0441\u043d\u0443, \u0439\u043c\u043e\u0432\u0456\u0440\u043d\u043e, \u043e\u0431\u043c\u0435\u0436\u0443\u0454 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.",
+        "training_limited": "\u0414\u0430\u043d\u0438\u0445 \u043f\u0440\u043e \u0442\u0440\u0435\u043d\u0443\u0432\u0430\u043d\u043d\u044f \u043d\u0435\u0434\u043e\u0441\u0442\u0430\u0442\u043d\u044c\u043e.",
+        "training_strong": "\u0427\u0430\u0441\u0442\u043e\u0442\u0430 \u0442\u0440\u0435\u043d\u0443\u0432\u0430\u043d\u044c \u0432\u0438\u0433\u043b\u044f\u0434\u0430\u0454 \u0434\u043e\u0431\u0440\u0435.",
+        "training_moderate": "\u041f\u043e\u043c\u0456\u0440\u043d\u0430 \u0430\u043a\u0442\u0438\u0432\u043d\u0456\u0441\u0442\u044c; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u043e\u0432\u0430\u043d\u043e \u043f\u0440\u043e\u0433\u0440\u0435\u0441\u0456\u044e.",
+        "training_unstructured": "\u0410\u043a\u0442\u0438\u0432\u043d\u0456\u0441\u0442\u044c \u0454, \u0430\u043b\u0435 \u0441\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u0443 \u0432\u0430\u0440\u0442\u043e \u043f\u043e\u043a\u0440\u0430\u0449\u0438\u0442\u0438.",
+        "nutrition_default": "\u0420\u0435\u0436\u0438\u043c \u0445\u0430\u0440\u0447\u0443\u0432\u0430\u043d\u043d\u044f \u043f\u043e\u0442\u0440\u0435\u0431\u0443\u0454 \u0441\u0442\u0430\u0431\u0456\u043b\u044c\u043d\u043e\u0441\u0442\u0456.",
+        "nutrition_supportive": "\u0421\u0442\u0438\u043b\u044c \u0445\u0430\u0440\u0447\u0443\u0432\u0430\u043d\u043d\u044f \u0432\u0438\u0433\u043b\u044f\u0434\u0430\u0454 \u0441\u043f\u0440\u0438\u044f\u0442\u043b\u0438\u0432\u0438\u043c.",
+        "nutrition_keto": "\u0421\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u043e\u0432\u0430\u043d\u0438\u0439 \u043f\u0456\u0434\u0445\u0456\u0434; \u0441\u0442\u0435\u0436\u0442\u0435 \u0437\u0430 \u0434\u043e\u0442\u0440\u0438\u043c\u0430\u043d\u043d\u044f\u043c \u0442\u0430 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f\u043c.",
+        "alcohol_frequent": "\u0427\u0430\u0441\u0442\u0435 \u0432\u0436\u0438\u0432\u0430\u043d\u043d\u044f \u0430\u043b\u043a\u043e\u0433\u043e\u043b\u044e \u043c\u043e\u0436\u0435 \u0437\u043d\u0438\u0436\u0443\u0432\u0430\u0442\u0438 \u044f\u043a\u0456\u0441\u0442\u044c \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.",
+        "recovery_default": "\u041a\u0435\u0440\u0443\u0432\u0430\u043d\u043d\u044f \u0441\u0442\u0440\u0435\u0441\u043e\u043c \u0441\u043b\u0456\u0434 \u043a\u043e\u043d\u0442\u0440\u043e\u043b\u044e\u0432\u0430\u0442\u0438.",
+        "stress_low": "\u041d\u0438\u0437\u044c\u043a\u0438\u0439 \u0440\u0456\u0432\u0435\u043d\u044c \u0441\u0442\u0440\u0435\u0441\u0443 \u0441\u043f\u0440\u0438\u044f\u0454 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044e.",
+        "stress_moderate": "\u041f\u043e\u043c\u0456\u0440\u043d\u0438\u0439 \u0441\u0442\u0440\u0435\u0441; \u043f\u0456\u0434\u0442\u0440\u0438\u043c\u0443\u0439\u0442\u0435 \u0440\u0435\u0436\u0438\u043c \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.",
+        "stress_elevated": "\u041f\u0456\u0434\u0432\u0438\u0449\u0435\u043d\u0438\u0439 \u0441\u0442\u0440\u0435\u0441; \u0434\u043e\u0434\u0430\u0439\u0442\u0435 \u0449\u043e\u0434\u0435\u043d\u043d\u0456 \u043f\u0440\u0430\u043a\u0442\u0438\u043a\u0438 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.",
+        "stress_high": "\u0412\u0438\u0441\u043e\u043a\u0438\u0439 \u0441\u0442\u0440\u0435\u0441, \u0439\u043c\u043e\u0432\u0456\u0440\u043d\u043e, \u0433\u0430\u043b\u044c\u043c\u0443\u0454 \u043f\u0440\u043e\u0433\u0440\u0435\u0441.",
+        "risk_default": "\u0421\u0443\u0442\u0442\u0454\u0432\u0438\u0445 \u043f\u043e\u0432\u0435\u0434\u0456\u043d\u043a\u043e\u0432\u0438\u0445 \u0444\u0430\u043a\u0442\u043e\u0440\u0456\u0432 \u0440\u0438\u0437\u0438\u043a\u0443 \u043d\u0435 \u0432\u0438\u044f\u0432\u043b\u0435\u043d\u043e.",
+        "risk_smoking_sometimes": "\u0420\u0438\u0437\u0438\u043a \u0432\u0456\u0434 \u043a\u0443\u0440\u0456\u043d\u043d\u044f \u043f\u0440\u0438\u0441\u0443\u0442\u043d\u0456\u0439; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u043e\u0432\u0430\u043d\u043e \u0437\u043c\u0435\u043d\u0448\u0443\u0432\u0430\u0442\u0438.",
+        "risk_smoking_yes": "\u041a\u0443\u0440\u0456\u043d\u043d\u044f \u0454 \u0444\u0430\u043a\u0442\u043e\u0440\u043e\u043c \u0432\u0438\u0441\u043e\u043a\u043e\u0433\u043e \u043f\u0440\u0456\u043e\u0440\u0438\u0442\u0435\u0442\u0443 \u0440\u0438\u0437\u0438\u043a\u0443.",
+    },
+    "ru": {
+        "sleep_no_data": "\u041d\u0435\u0442 \u0434\u0430\u043d\u043d\u044b\u0445 \u043e \u0441\u043d\u0435.",
+        "sleep_ok": "\u041f\u0440\u043e\u0434\u043e\u043b\u0436\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0441\u0442\u044c \u0441\u043d\u0430 \u0432 \u0446\u0435\u043b\u0435\u0432\u043e\u043c \u0434\u0438\u0430\u043f\u0430\u0437\u043e\u043d\u0435.",
+        "sleep_acceptable": "\u0421\u043e\u043d \u043f\u0440\u0438\u0435\u043c\u043b\u0435\u043c\u044b\u0439, \u043d\u043e \u0435\u0433\u043e \u043c\u043e\u0436\u043d\u043e \u0443\u043b\u0443\u0447\u0448\u0438\u0442\u044c.",
+        "sleep_short": "\u0421\u043e\u043d, \u043f\u043e\u0445\u043e\u0436\u0435, \u043a\u043e\u0440\u043e\u0442\u043a\u0438\u0439; \u043f\u043e\u0432\u044b\u0441\u044c\u0442\u0435 \u0441\u0442\u0430\u0431\u0438\u043b\u044c\u043d\u043e\u0441\u0442\u044c.",
+        "sleep_limits_recovery": "\u041f\u0440\u043e\u0434\u043e\u043b\u0436\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0441\u0442\u044c \u0441\u043d\u0430, \u0432\u0435\u0440\u043e\u044f\u0442\u043d\u043e, \u043e\u0433\u0440\u0430\u043d\u0438\u0447\u0438\u0432\u0430\u0435\u0442 \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u0435.",
+        "training_limited": "\u0414\u0430\u043d\u043d\u044b\u0445 \u043e \u0442\u0440\u0435\u043d\u0438\u0440\u043e\u0432\u043a\u0430\u0445 \u043d\u0435\u0434\u043e\u0441\u0442\u0430\u0442\u043e\u0447\u043d\u043e.",
+        "training_strong": "\u0427\u0430\u0441\u0442\u043e\u0442\u0430 \u0442\u0440\u0435\u043d\u0438\u0440\u043e\u0432\u043e\u043a \u0432\u044b\u0433\u043b\u044f\u0434\u0438\u0442 \u0441\u0438\u043b\u044c\u043d\u043e\u0439.",
+        "training_moderate": "\u0423\u043c\u0435\u0440\u0435\u043d\u043d\u0430\u044f \u0430\u043a\u0442\u0438\u0432\u043d\u043e\u0441\u0442\u044c; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u0443\u0435\u0442\u0441\u044f \u043f\u0440\u043e\u0433\u0440\u0435\u0441\u0441\u0438\u044f.",
+        "training_unstructured": "\u0410\u043a\u0442\u0438\u0432\u043d\u043e\u0441\u0442\u044c \u0435\u0441\u0442\u044c, \u043d\u043e \u0441\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u0443 \u0441\u0442\u043e\u0438\u0442 \u0443\u043b\u0443\u0447\u0448\u0438\u0442\u044c.",
+        "nutrition_default": "\u0420\u0435\u0436\u0438\u043c \u043f\u0438\u0442\u0430\u043d\u0438\u044f \u043d\u0443\u0436\u0434\u0430\u0435\u0442\u0441\u044f \u0432 \u0441\u0442\u0430\u0431\u0438\u043b\u044c\u043d\u043e\u0441\u0442\u0438.",
+        "nutrition_supportive": "\u0421\u0442\u0438\u043b\u044c \u043f\u0438\u0442\u0430\u043d\u0438\u044f \u0432\u044b\u0433\u043b\u044f\u0434\u0438\u0442 \u043f\u043e\u0434\u0445\u043e\u0434\u044f\u0449\u0438\u043c.",
+        "nutrition_keto": "\u0421\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u043d\u044b\u0439 \u043f\u043e\u0434\u0445\u043e\u0434; \u043e\u0442\u0441\u043b\u0435\u0436\u0438\u0432\u0430\u0439\u0442\u0435 \u043f\u0440\u0438\u0432\u0435\u0440\u0436\u0435\u043d\u043d\u043e\u0441\u0442\u044c \u0438 \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u0435.",
+        "alcohol_frequent": "\u0427\u0430\u0441\u0442\u043e\u0435 \u0443\u043f\u043e\u0442\u0440\u0435\u0431\u043b\u0435\u043d\u0438\u0435 \u0430\u043b\u043a\u043e\u0433\u043e\u043b\u044f \u043c\u043e\u0436\u0435\u0442 \u0441\u043d\u0438\u0436\u0430\u0442\u044c \u043a\u0430\u0447\u0435\u0441\u0442\u0432\u043e \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u044f.",
+        "recovery_default": "\u0423\u043f\u0440\u0430\u0432\u043b\u0435\u043d\u0438\u0435 \u0441\u0442\u0440\u0435\u0441\u0441\u043e\u043c \u0441\u043b\u0435\u0434\u0443\u0435\u0442 \u043a\u043e\u043d\u0442\u0440\u043e\u043b\u0438\u0440\u043e\u0432\u0430\u0442\u044c.",
+        "stress_low": "\u041d\u0438\u0437\u043a\u0438\u0439 \u0443\u0440\u043e\u0432\u0435\u043d\u044c \u0441\u0442\u0440\u0435\u0441\u0441\u0430 \u043f\u043e\u0434\u0434\u0435\u0440\u0436\u0438\u0432\u0430\u0435\u0442 \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u0435.",
+        "stress_moderate": "\u0423\u043c\u0435\u0440\u0435\u043d\u043d\u044b\u0439 \u0441\u0442\u0440\u0435\u0441\u0441; \u043f\u043e\u0434\u0434\u0435\u0440\u0436\u0438\u0432\u0430\u0439\u0442\u0435 \u0440\u0435\u0436\u0438\u043c \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u044f.",
+        "stress_elevated": "\u041f\u043e\u0432\u044b\u0448\u0435\u043d\u043d\u044b\u0439 \u0441\u0442\u0440\u0435\u0441\u0441; \u0434\u043e\u0431\u0430\u0432\u044c\u0442\u0435 \u0435\u0436\u0435\u0434\u043d\u0435\u0432\u043d\u044b\u0435 \u043f\u0440\u0430\u043a\u0442\u0438\u043a\u0438 \u0441\u043d\u0438\u0436\u0435\u043d\u0438\u044f \u043d\u0430\u043f\u0440\u044f\u0436\u0435\u043d\u0438\u044f.",
+        "stress_high": "\u0412\u044b\u0441\u043e\u043a\u0438\u0439 \u0441\u0442\u0440\u0435\u0441\u0441, \u0432\u0435\u0440\u043e\u044f\u0442\u043d\u043e, \u0442\u043e\u0440\u043c\u043e\u0437\u0438\u0442 \u043f\u0440\u043e\u0433\u0440\u0435\u0441\u0441.",
+        "risk_default": "\u0421\u0435\u0440\u044c\u0435\u0437\u043d\u044b\u0445 \u043f\u043e\u0432\u0435\u0434\u0435\u043d\u0447\u0435\u0441\u043a\u0438\u0445 \u0444\u0430\u043a\u0442\u043e\u0440\u043e\u0432 \u0440\u0438\u0441\u043a\u0430 \u043d\u0435 \u0432\u044b\u044f\u0432\u043b\u0435\u043d\u043e.",
+        "risk_smoking_sometimes": "\u0420\u0438\u0441\u043a \u043e\u0442 \u043a\u0443\u0440\u0435\u043d\u0438\u044f \u043f\u0440\u0438\u0441\u0443\u0442\u0441\u0442\u0432\u0443\u0435\u0442; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u0443\u0435\u0442\u0441\u044f \u0441\u043d\u0438\u0436\u0435\u043d\u0438\u0435.",
+        "risk_smoking_yes": "\u041a\u0443\u0440\u0435\u043d\u0438\u0435 \u2014 \u0432\u044b\u0441\u043e\u043a\u043e\u043f\u0440\u0438\u043e\u0440\u0438\u0442\u0435\u0442\u043d\u044b\u0439 \u0444\u0430\u043a\u0442\u043e\u0440 \u0440\u0438\u0441\u043a\u0430.",
+    },
+}
+
+
+# Compiled once; each answer field is scanned a single time instead of one
+# substring pass per keyword.
+_TRAIN_FREQ_RE = re.compile(r"[345]")
+_NUTRI_GOOD_RE = re.compile(r"protein|balanced")
+_ALC_DAILY_RE = re.compile(r"daily|every day")
+
+
+def _s(value: Any) -> str:
+    # Row values are usually str already; skip the str() dispatch for them.
+    return value if value.__class__ is str else str(value)
+
+
+def _lc(value: Any) -> str:
+    # Answers are almost always str already; lowercase directly and only
+    # stringify the odd non-str value.
+    return value.lower() if isinstance(value, str) else str(value or "").lower()
 
 
 def _compute_section_scores(answers: dict[str, Any], lang: str) -> list[dict[str, str | int]]:
-    def loc(en: str, uk: str, ru: str) -> str:
-        if lang == "uk":
-            return uk
-        if lang == "ru":
-            return ru
-        return en
+    S = _SCORE_STRINGS.get(lang) or _SCORE_STRINGS["en"]
 
     sleep_h = _to_float(answers.get("sleep_hours"))
     stress = _to_float(answers.get("stress"))
-    smoking = str(answers.get("smoking", "")).lower()
-    training = str(answers.get("training", "")).lower()
-    nutrition = str(answers.get("nutrition", "")).lower()
-    alcohol = str(answers.get("alcohol", "")).lower()
+    smoking = _lc(answers.get("smoking", ""))
+    training = _lc(answers.get("training", ""))
+    nutrition = _lc(answers.get("nutrition", ""))
+    alcohol = _lc(answers.get("alcohol", ""))
 
     sleep_score = 60
-    sleep_note = loc("No sleep data.", "\u041d\u0435\u043c\u0430\u0454 \u0434\u0430\u043d\u0438\u0445 \u043f\u0440\u043e \u0441\u043e\u043d.", "\u041d\u0435\u0442 \u0434\u0430\u043d\u043d\u044b\u0445 \u043e \u0441\u043d\u0435.")
+    sleep_note = S["sleep_no_data"]
     if sleep_h is not None:
         if 7 <= sleep_h <= 9:
-            sleep_score, sleep_note = 90, loc("Sleep duration is in target range.", "\u0422\u0440\u0438\u0432\u0430\u043b\u0456\u0441\u0442\u044c \u0441\u043d\u0443 \u0432 \u0446\u0456\u043b\u044c\u043e\u0432\u043e\u043c\u0443 \u0434\u0456\u0430\u043f\u0430\u0437\u043e\u043d\u0456.", "\u041f\u0440\u043e\u0434\u043e\u043b\u0436\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0441\u0442\u044c \u0441\u043d\u0430 \u0432 \u0446\u0435\u043b\u0435\u0432\u043e\u043c \u0434\u0438\u0430\u043f\u0430\u0437\u043e\u043d\u0435.")
+            sleep_score, sleep_note = 90, S["sleep_ok"]
         elif 6 <= sleep_h < 7 or 9 < sleep_h <= 10:
-            sleep_score, sleep_note = 75, loc("Sleep is acceptable but can be optimized.", "\u0421\u043e\u043d \u043f\u0440\u0438\u0439\u043d\u044f\u0442\u043d\u0438\u0439, \u0430\u043b\u0435 \u0454 \u043f\u043e\u0442\u0435\u043d\u0446\u0456\u0430\u043b \u0434\u043b\u044f \u043f\u043e\u043a\u0440\u0430\u0449\u0435\u043d\u043d\u044f.", "\u0421\u043e\u043d \u043f\u0440\u0438\u0435\u043c\u043b\u0435\u043c\u044b\u0439, \u043d\u043e \u0435\u0433\u043e \u043c\u043e\u0436\u043d\u043e \u0443\u043b\u0443\u0447\u0448\u0438\u0442\u044c.")
+            sleep_score, sleep_note = 75, S["sleep_acceptable"]
         elif 5 <= sleep_h < 6:
-            sleep_score, sleep_note = 55, loc("Sleep appears short; increase consistency.", "\u0421\u043e\u043d \u0432\u0438\u0433\u043b\u044f\u0434\u0430\u0454 \u043a\u043e\u0440\u043e\u0442\u043a\u0438\u043c; \u043f\u0456\u0434\u0432\u0438\u0449\u0456\u0442\u044c \u0441\u0442\u0430\u0431\u0456\u043b\u044c\u043d\u0456\u0441\u0442\u044c.", "\u0421\u043e\u043d, \u043f\u043e\u0445\u043e\u0436\u0435, \u043a\u043e\u0440\u043e\u0442\u043a\u0438\u0439; \u043f\u043e\u0432\u044b\u0441\u044c\u0442\u0435 \u0441\u0442\u0430\u0431\u0438\u043b\u044c\u043d\u043e\u0441\u0442\u044c.")
+            sleep_score, sleep_note = 55, S["sleep_short"]
         else:
-            sleep_score, sleep_note = 40, loc("Sleep duration likely limits recovery.", "\u0422\u0440\u0438\u0432\u0430\u043b\u0456\u0441\u0442\u044c \u0441\u043d\u0443, \u0439\u043c\u043e\u0432\u0456\u0440\u043d\u043e, \u043e\u0431\u043c\u0435\u0436\u0443\u0454 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.", "\u041f\u0440\u043e\u0434\u043e\u043b\u0436\u0438\u0442\u0435\u043b\u044c\u043d\u043e\u0441\u0442\u044c \u0441\u043d\u0430, \u0432\u0435\u0440\u043e\u044f\u0442\u043d\u043e, \u043e\u0433\u0440\u0430\u043d\u0438\u0447\u0438\u0432\u0430\u0435\u0442 \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u0435.")
+            sleep_score, sleep_note = 40, S["sleep_limits_recovery"]
 
     activity_score = 60
-    activity_note = loc("Training details are limited.", "\u0414\u0430\u043d\u0438\u0445 \u043f\u0440\u043e \u0442\u0440\u0435\u043d\u0443\u0432\u0430\u043d\u043d\u044f \u043d\u0435\u0434\u043e\u0441\u0442\u0430\u0442\u043d\u044c\u043e.", "\u0414\u0430\u043d\u043d\u044b\u0445 \u043e \u0442\u0440\u0435\u043d\u0438\u0440\u043e\u0432\u043a\u0430\u0445 \u043d\u0435\u0434\u043e\u0441\u0442\u0430\u0442\u043e\u0447\u043d\u043e.")
-    if "3" in training or "4" in training or "5" in training:
-        activity_score, activity_note = 85, loc("Training frequency appears strong.", "\u0427\u0430\u0441\u0442\u043e\u0442\u0430 \u0442\u0440\u0435\u043d\u0443\u0432\u0430\u043d\u044c \u0432\u0438\u0433\u043b\u044f\u0434\u0430\u0454 \u0434\u043e\u0431\u0440\u0435.", "\u0427\u0430\u0441\u0442\u043e\u0442\u0430 \u0442\u0440\u0435\u043d\u0438\u0440\u043e\u0432\u043e\u043a \u0432\u044b\u0433\u043b\u044f\u0434\u0438\u0442 \u0441\u0438\u043b\u044c\u043d\u043e\u0439.")
+    activity_note = S["training_limited"]
+    if _TRAIN_FREQ_RE.search(training):
+        activity_score, activity_note = 85, S["training_strong"]
     elif "2" in training:
-        activity_score, activity_note = 72, loc("Moderate activity; progression recommended.", "\u041f\u043e\u043c\u0456\u0440\u043d\u0430 \u0430\u043a\u0442\u0438\u0432\u043d\u0456\u0441\u0442\u044c; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u043e\u0432\u0430\u043d\u043e \u043f\u0440\u043e\u0433\u0440\u0435\u0441\u0456\u044e.", "\u0423\u043c\u0435\u0440\u0435\u043d\u043d\u0430\u044f \u0430\u043a\u0442\u0438\u0432\u043d\u043e\u0441\u0442\u044c; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u0443\u0435\u0442\u0441\u044f \u043f\u0440\u043e\u0433\u0440\u0435\u0441\u0441\u0438\u044f.")
+        activity_score, activity_note = 72, S["training_moderate"]
     elif training.strip():
-        activity_score, activity_note = 62, loc("Activity exists but structure can improve.", "\u0410\u043a\u0442\u0438\u0432\u043d\u0456\u0441\u0442\u044c \u0454, \u0430\u043b\u0435 \u0441\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u0443 \u0432\u0430\u0440\u0442\u043e \u043f\u043e\u043a\u0440\u0430\u0449\u0438\u0442\u0438.", "\u0410\u043a\u0442\u0438\u0432\u043d\u043e\u0441\u0442\u044c \u0435\u0441\u0442\u044c, \u043d\u043e \u0441\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u0443 \u0441\u0442\u043e\u0438\u0442 \u0443\u043b\u0443\u0447\u0448\u0438\u0442\u044c.")
+        activity_score, activity_note = 62, S["training_unstructured"]
 
     nutrition_score = 65
-    nutrition_note = loc("Nutrition pattern needs consistency.", "\u0420\u0435\u0436\u0438\u043c \u0445\u0430\u0440\u0447\u0443\u0432\u0430\u043d\u043d\u044f \u043f\u043e\u0442\u0440\u0435\u0431\u0443\u0454 \u0441\u0442\u0430\u0431\u0456\u043b\u044c\u043d\u043e\u0441\u0442\u0456.", "\u0420\u0435\u0436\u0438\u043c \u043f\u0438\u0442\u0430\u043d\u0438\u044f \u043d\u0443\u0436\u0434\u0430\u0435\u0442\u0441\u044f \u0432 \u0441\u0442\u0430\u0431\u0438\u043b\u044c\u043d\u043e\u0441\u0442\u0438.")
-    if "protein" in nutrition or "balanced" in nutrition:
-        nutrition_score, nutrition_note = 82, loc("Nutrition style looks supportive.", "\u0421\u0442\u0438\u043b\u044c \u0445\u0430\u0440\u0447\u0443\u0432\u0430\u043d\u043d\u044f \u0432\u0438\u0433\u043b\u044f\u0434\u0430\u0454 \u0441\u043f\u0440\u0438\u044f\u0442\u043b\u0438\u0432\u0438\u043c.", "\u0421\u0442\u0438\u043b\u044c \u043f\u0438\u0442\u0430\u043d\u0438\u044f \u0432\u044b\u0433\u043b\u044f\u0434\u0438\u0442 \u043f\u043e\u0434\u0445\u043e\u0434\u044f\u0449\u0438\u043c.")
+    nutrition_note = S["nutrition_default"]
+    if _NUTRI_GOOD_RE.search(nutrition):
+        nutrition_score, nutrition_note = 82, S["nutrition_supportive"]
     if "keto" in nutrition:
         nutrition_score = max(nutrition_score, 75)
-        nutrition_note = loc("Structured approach; monitor adherence and recovery.", "\u0421\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u043e\u0432\u0430\u043d\u0438\u0439 \u043f\u0456\u0434\u0445\u0456\u0434; \u0441\u0442\u0435\u0436\u0442\u0435 \u0437\u0430 \u0434\u043e\u0442\u0440\u0438\u043c\u0430\u043d\u043d\u044f\u043c \u0442\u0430 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f\u043c.", "\u0421\u0442\u0440\u0443\u043a\u0442\u0443\u0440\u043d\u044b\u0439 \u043f\u043e\u0434\u0445\u043e\u0434; \u043e\u0442\u0441\u043b\u0435\u0436\u0438\u0432\u0430\u0439\u0442\u0435 \u043f\u0440\u0438\u0432\u0435\u0440\u0436\u0435\u043d\u043d\u043e\u0441\u0442\u044c \u0438 \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u0435.")
-    if "daily" in alcohol or "every day" in alcohol:
+        nutrition_note = S["nutrition_keto"]
+    if _ALC_DAILY_RE.search(alcohol):
         nutrition_score = _clamp(nutrition_score - 18)
-        nutrition_note = loc("Frequent alcohol can reduce recovery quality.", "\u0427\u0430\u0441\u0442\u0435 \u0432\u0436\u0438\u0432\u0430\u043d\u043d\u044f \u0430\u043b\u043a\u043e\u0433\u043e\u043b\u044e \u043c\u043e\u0436\u0435 \u0437\u043d\u0438\u0436\u0443\u0432\u0430\u0442\u0438 \u044f\u043a\u0456\u0441\u0442\u044c \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.", "\u0427\u0430\u0441\u0442\u043e\u0435 \u0443\u043f\u043e\u0442\u0440\u0435\u0431\u043b\u0435\u043d\u0438\u0435 \u0430\u043b\u043a\u043e\u0433\u043e\u043b\u044f \u043c\u043e\u0436\u0435\u0442 \u0441\u043d\u0438\u0436\u0430\u0442\u044c \u043a\u0430\u0447\u0435\u0441\u0442\u0432\u043e \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u044f.")
+        nutrition_note = S["alcohol_frequent"]
 
     recovery_score = 65
-    recovery_note = loc("Stress management should be monitored.", "\u041a\u0435\u0440\u0443\u0432\u0430\u043d\u043d\u044f \u0441\u0442\u0440\u0435\u0441\u043e\u043c \u0441\u043b\u0456\u0434 \u043a\u043e\u043d\u0442\u0440\u043e\u043b\u044e\u0432\u0430\u0442\u0438.", "\u0423\u043f\u0440\u0430\u0432\u043b\u0435\u043d\u0438\u0435 \u0441\u0442\u0440\u0435\u0441\u0441\u043e\u043c \u0441\u043b\u0435\u0434\u0443\u0435\u0442 \u043a\u043e\u043d\u0442\u0440\u043e\u043b\u0438\u0440\u043e\u0432\u0430\u0442\u044c.")
+    recovery_note = S["recovery_default"]
     if stress is not None:
         if stress <= 3:
-            recovery_score, recovery_note = 88, loc("Low stress profile supports recovery.", "\u041d\u0438\u0437\u044c\u043a\u0438\u0439 \u0440\u0456\u0432\u0435\u043d\u044c \u0441\u0442\u0440\u0435\u0441\u0443 \u0441\u043f\u0440\u0438\u044f\u0454 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044e.", "\u041d\u0438\u0437\u043a\u0438\u0439 \u0443\u0440\u043e\u0432\u0435\u043d\u044c \u0441\u0442\u0440\u0435\u0441\u0441\u0430 \u043f\u043e\u0434\u0434\u0435\u0440\u0436\u0438\u0432\u0430\u0435\u0442 \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u0435.")
+            recovery_score, recovery_note = 88, S["stress_low"]
         elif stress <= 6:
-            recovery_score, recovery_note = 72, loc("Moderate stress; maintain recovery routines.", "\u041f\u043e\u043c\u0456\u0440\u043d\u0438\u0439 \u0441\u0442\u0440\u0435\u0441; \u043f\u0456\u0434\u0442\u0440\u0438\u043c\u0443\u0439\u0442\u0435 \u0440\u0435\u0436\u0438\u043c \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.", "\u0423\u043c\u0435\u0440\u0435\u043d\u043d\u044b\u0439 \u0441\u0442\u0440\u0435\u0441\u0441; \u043f\u043e\u0434\u0434\u0435\u0440\u0436\u0438\u0432\u0430\u0439\u0442\u0435 \u0440\u0435\u0436\u0438\u043c \u0432\u043e\u0441\u0441\u0442\u0430\u043d\u043e\u0432\u043b\u0435\u043d\u0438\u044f.")
+            recovery_score, recovery_note = 72, S["stress_moderate"]
         elif stress <= 8:
-            recovery_score, recovery_note = 55, loc("Elevated stress; add daily down-regulation.", "\u041f\u0456\u0434\u0432\u0438\u0449\u0435\u043d\u0438\u0439 \u0441\u0442\u0440\u0435\u0441; \u0434\u043e\u0434\u0430\u0439\u0442\u0435 \u0449\u043e\u0434\u0435\u043d\u043d\u0456 \u043f\u0440\u0430\u043a\u0442\u0438\u043a\u0438 \u0432\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f.", "\u041f\u043e\u0432\u044b\u0448\u0435\u043d\u043d\u044b\u0439 \u0441\u0442\u0440\u0435\u0441\u0441; \u0434\u043e\u0431\u0430\u0432\u044c\u0442\u0435 \u0435\u0436\u0435\u0434\u043d\u0435\u0432\u043d\u044b\u0435 \u043f\u0440\u0430\u043a\u0442\u0438\u043a\u0438 \u0441\u043d\u0438\u0436\u0435\u043d\u0438\u044f \u043d\u0430\u043f\u0440\u044f\u0436\u0435\u043d\u0438\u044f.")
+            recovery_score, recovery_note = 55, S["stress_elevated"]
         else:
-            recovery_score, recovery_note = 42, loc("High stress likely affects progress.", "\u0412\u0438\u0441\u043e\u043a\u0438\u0439 \u0441\u0442\u0440\u0435\u0441, \u0439\u043c\u043e\u0432\u0456\u0440\u043d\u043e, \u0433\u0430\u043b\u044c\u043c\u0443\u0454 \u043f\u0440\u043e\u0433\u0440\u0435\u0441.", "\u0412\u044b\u0441\u043e\u043a\u0438\u0439 \u0441\u0442\u0440\u0435\u0441\u0441, \u0432\u0435\u0440\u043e\u044f\u0442\u043d\u043e, \u0442\u043e\u0440\u043c\u043e\u0437\u0438\u0442 \u043f\u0440\u043e\u0433\u0440\u0435\u0441\u0441.")
+            recovery_score, recovery_note = 42, S["stress_high"]
 
     risk_score = 80
-    risk_note = loc("No major lifestyle risk marker detected.", "\u0421\u0443\u0442\u0442\u0454\u0432\u0438\u0445 \u043f\u043e\u0432\u0435\u0434\u0456\u043d\u043a\u043e\u0432\u0438\u0445 \u0444\u0430\u043a\u0442\u043e\u0440\u0456\u0432 \u0440\u0438\u0437\u0438\u043a\u0443 \u043d\u0435 \u0432\u0438\u044f\u0432\u043b\u0435\u043d\u043e.", "\u0421\u0435\u0440\u044c\u0435\u0437\u043d\u044b\u0445 \u043f\u043e\u0432\u0435\u0434\u0435\u043d\u0447\u0435\u0441\u043a\u0438\u0445 \u0444\u0430\u043a\u0442\u043e\u0440\u043e\u0432 \u0440\u0438\u0441\u043a\u0430 \u043d\u0435 \u0432\u044b\u044f\u0432\u043b\u0435\u043d\u043e.")
+    risk_note = S["risk_default"]
     if smoking == "sometimes":
-        risk_score, risk_note = 62, loc("Smoking risk is present; reduction advised.", "\u0420\u0438\u0437\u0438\u043a \u0432\u0456\u0434 \u043a\u0443\u0440\u0456\u043d\u043d\u044f \u043f\u0440\u0438\u0441\u0443\u0442\u043d\u0456\u0439; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u043e\u0432\u0430\u043d\u043e \u0437\u043c\u0435\u043d\u0448\u0443\u0432\u0430\u0442\u0438.", "\u0420\u0438\u0441\u043a \u043e\u0442 \u043a\u0443\u0440\u0435\u043d\u0438\u044f \u043f\u0440\u0438\u0441\u0443\u0442\u0441\u0442\u0432\u0443\u0435\u0442; \u0440\u0435\u043a\u043e\u043c\u0435\u043d\u0434\u0443\u0435\u0442\u0441\u044f \u0441\u043d\u0438\u0436\u0435\u043d\u0438\u0435.")
+        risk_score, risk_note = 62, S["risk_smoking_sometimes"]
     if smoking == "yes":
-        risk_score, risk_note = 40, loc("Smoking is a high-priority risk factor.", "\u041a\u0443\u0440\u0456\u043d\u043d\u044f \u0454 \u0444\u0430\u043a\u0442\u043e\u0440\u043e\u043c \u0432\u0438\u0441\u043e\u043a\u043e\u0433\u043e \u043f\u0440\u0456\u043e\u0440\u0438\u0442\u0435\u0442\u0443 \u0440\u0438\u0437\u0438\u043a\u0443.", "\u041a\u0443\u0440\u0435\u043d\u0438\u0435 \u2014 \u0432\u044b\u0441\u043e\u043a\u043e\u043f\u0440\u0438\u043e\u0440\u0438\u0442\u0435\u0442\u043d\u044b\u0439 \u0444\u0430\u043a\u0442\u043e\u0440 \u0440\u0438\u0441\u043a\u0430.")
+        risk_score, risk_note = 40, S["risk_smoking_yes"]
 
     if lang == "uk":
         labels = ("\u0421\u043e\u043d", "\u0410\u043a\u0442\u0438\u0432\u043d\u0456\u0441\u0442\u044c", "\u0425\u0430\u0440\u0447\u0443\u0432\u0430\u043d\u043d\u044f", "\u0412\u0456\u0434\u043d\u043e\u0432\u043b\u0435\u043d\u043d\u044f", "\u0420\u0438\u0437\u0438\u043a")
@@ -268,83 +476,189 @@ def _compute_section_scores(answers: dict[str, Any], lang: str) -> list[dict[str
     ]
 
 
-def build_pdf(report_json: dict[str, Any], lang: str = "en") -> bytes:
-    theme = {
-        "ink": colors.HexColor("#0B1220"),
-        "muted": colors.HexColor("#5B677A"),
-        "accent": colors.HexColor("#2563EB"),
-        "accent_soft": colors.HexColor("#EAF1FF"),
-        "panel": colors.HexColor("#F8FAFC"),
-        "grid": colors.HexColor("#D8E0EA"),
-    }
-
-    def section_header(text: str, styles_: dict[str, ParagraphStyle]) -> Table:
-        t = Table([[text]], colWidths=[170 * mm], hAlign="LEFT")
-        t.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, -1), theme["accent_soft"]),
-                    ("TEXTCOLOR", (0, 0), (-1, -1), theme["ink"]),
-                    ("FONTNAME", (0, 0), (-1, -1), bold_font),
-                    ("FONTSIZE", (0, 0), (-1, -1), 12),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                    ("TOPPADDING", (0, 0), (-1, -1), 7),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 7),
-                ]
-            )
-        )
-        return t
-
-    def draw_chrome(canvas_obj, doc_obj):
-        canvas_obj.saveState()
-        canvas_obj.setFillColor(theme["muted"])
-        canvas_obj.setFont(regular_font, 8)
-        canvas_obj.drawString(doc_obj.leftMargin, 8 * mm, "BioAge Reset Protocol")
-        canvas_obj.drawRightString(A4[0] - doc_obj.rightMargin, 8 * mm, str(canvas_obj.getPageNumber()))
-        canvas_obj.restoreState()
-
-    buf = BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=A4,
-        title="BioAge Reset Report",
-        leftMargin=18 * mm,
-        rightMargin=18 * mm,
-        topMargin=18 * mm,
-        bottomMargin=16 * mm,
-    )
+@lru_cache(maxsize=1)
+def _base_styles() -> Any:
+    """Build the report stylesheet once; getSampleStyleSheet constructs a
+    full set of ParagraphStyle objects and is too expensive to repeat per PDF."""
     styles = getSampleStyleSheet()
     regular_font, bold_font = _register_unicode_fonts()
-    styles["Normal"].fontName = regular_font
-    styles["BodyText"].fontName = regular_font
-    styles["Italic"].fontName = regular_font
-    styles["Title"].fontName = bold_font
-    styles["Heading1"].fontName = bold_font
-    styles["Heading2"].fontName = bold_font
-    styles["Heading3"].fontName = bold_font
-    styles.add(ParagraphStyle(name="Muted", parent=styles["BodyText"], textColor=theme["muted"]))
+    for name in ("Normal", "BodyText", "Italic"):
+        styles[name].fontName = regular_font
+    for name in ("Title", "Heading1", "Heading2", "Heading3"):
+        styles[name].fontName = bold_font
+    styles.add(ParagraphStyle(name="Muted", parent=styles["BodyText"], textColor=colors.HexColor("#5B677A")))
     styles.add(ParagraphStyle(name="Small", parent=styles["BodyText"], fontSize=9, leading=12))
     styles.add(ParagraphStyle(name="Lead", parent=styles["BodyText"], fontSize=10.5, leading=15))
     styles["Heading1"].fontSize = 20
     styles["Heading1"].leading = 24
     styles["Heading2"].fontSize = 14
     styles["Heading2"].leading = 18
+    return styles
+
+
+@lru_cache(maxsize=None)
+def _section_header_proto(lang: str, key: str) -> Table:
+    bold_font = _base_styles()["Title"].fontName
+    t = Table([[_t(lang, key)]], colWidths=[170 * mm], hAlign="LEFT")
+    t.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, -1), _THEME["accent_soft"]),
+                ("TEXTCOLOR", (0, 0), (-1, -1), _THEME["ink"]),
+                ("FONTNAME", (0, 0), (-1, -1), bold_font),
+                ("FONTSIZE", (0, 0), (-1, -1), 12),
+                ("LEFTPADDING", (0, 0), (-1, -1), 10),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+                ("TOPPADDING", (0, 0), (-1, -1), 7),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 7),
+            ]
+        )
+    )
+    return t
+
+
+def _section_header(lang: str, key: str) -> Table:
+    # doc.build mutates flowable state during layout, so hand out a shallow
+    # copy of the cached prototype instead of the prototype itself.
+    return copy.copy(_section_header_proto(lang, key))
+
+
+# Palette shared by every table/chrome in the report; colors are immutable,
+# so one module-level dict replaces the per-build reconstruction.
+_THEME = {
+    "ink": colors.HexColor("#0B1220"),
+    "muted": colors.HexColor("#5B677A"),
+    "accent": colors.HexColor("#2563EB"),
+    "accent_soft": colors.HexColor("#EAF1FF"),
+    "panel": colors.HexColor("#F8FAFC"),
+    "grid": colors.HexColor("#D8E0EA"),
+    "zebra": colors.HexColor("#FBFDFF"),
+}
+
+_PLAN_COL_WIDTHS = [20 * mm, 45 * mm, 95 * mm]
+_METRIC_COL_WIDTHS = [70 * mm, 70 * mm]
+_SCORE_COL_WIDTHS = [35 * mm, 25 * mm, 110 * mm]
+
+
+@lru_cache(maxsize=1)
+def _metric_table_style() -> TableStyle:
+    bold_font = _base_styles()["Title"].fontName
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _THEME["panel"]),
+            ("GRID", (0, 0), (-1, -1), 0.5, _THEME["grid"]),
+            ("FONTNAME", (0, 0), (-1, 0), bold_font),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, _THEME["zebra"]]),
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def _score_table_style() -> TableStyle:
+    bold_font = _base_styles()["Title"].fontName
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _THEME["ink"]),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("FONTNAME", (0, 0), (-1, 0), bold_font),
+            ("GRID", (0, 0), (-1, -1), 0.5, _THEME["grid"]),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, _THEME["zebra"]]),
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def _phase_title_style() -> TableStyle:
+    bold_font = _base_styles()["Title"].fontName
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, -1), _THEME["panel"]),
+            ("TEXTCOLOR", (0, 0), (-1, -1), _THEME["ink"]),
+            ("FONTNAME", (0, 0), (-1, -1), bold_font),
+            ("FONTSIZE", (0, 0), (-1, -1), 11),
+            ("LEFTPADDING", (0, 0), (-1, -1), 8),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+            ("TOPPADDING", (0, 0), (-1, -1), 6),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+        ]
+    )
+
+# Plan focus/action phrases come from a small template vocabulary that
+# repeats across reports; pool them so every in-flight render shares one
+# canonical str per phrase. dict.setdefault is atomic under the GIL, and
+# the cap keeps pathological free-text input from growing the pool forever.
+_STR_POOL: dict[str, str] = {}
+_STR_POOL_MAX = 4096
+
+
+def _pooled(s: str) -> str:
+    if len(_STR_POOL) >= _STR_POOL_MAX:
+        return _STR_POOL.get(s, s)
+    return _STR_POOL.setdefault(s, s)
+
+
+@lru_cache(maxsize=1)
+def _plan_table_style() -> TableStyle:
+    # Built once; passing a shared instance skips re-parsing the style
+    # commands on every render, and the fixed colWidths above skip Table's
+    # per-cell measurement pass entirely.
+    bold_font = _base_styles()["Title"].fontName
+    return TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, 0), _THEME["ink"]),
+            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+            ("FONTNAME", (0, 0), (-1, 0), bold_font),
+            ("GRID", (0, 0), (-1, -1), 0.5, _THEME["grid"]),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, _THEME["zebra"]]),
+        ]
+    )
 
-    story: list[Any] = []
-    title = str(report_json.get("title") or _t(lang, "cover_title"))
-    generated = str(report_json.get("generated_at_utc") or "")
 
+@lru_cache(maxsize=8)
+def _qlabels(lang: str) -> dict[str, str]:
+    # The question bank is fixed, so resolving every label per build was
+    # O(questions) of repeated work; one dict per language suffices.
+    return {q.qid: q.label(lang) for q in QUESTIONS}
+
+
+@lru_cache(maxsize=None)
+def _static_para_proto(lang: str, key: str, style_name: str) -> Paragraph:
+    return Paragraph(_t(lang, key), _base_styles()[style_name])
+
+
+def _static_para(lang: str, key: str, style_name: str) -> Paragraph:
+    # Same prototype-clone trick as the section headers: the text and style
+    # of these paragraphs never change per report, so the XML parse happens
+    # once per (lang, key) and layout works on a shallow copy.
+    return copy.copy(_static_para_proto(lang, key, style_name))
+
+
+def _bullet_list(items: Any, style: ParagraphStyle) -> ListFlowable:
+    # One ListFlowable lays the bullets out as a group with style-driven
+    # glyphs instead of N free-standing Paragraphs with literal dashes.
+    return ListFlowable(
+        [ListItem(Paragraph(_xml_escape(str(item)), style)) for item in items],
+        bulletType="bullet",
+        start="bulletchar",
+    )
+
+
+@lru_cache(maxsize=8)
+def _cover_table_proto(lang: str, title: str) -> Table:
+    bold_font = _base_styles()["Title"].fontName
     cover = Table([[title], [_t(lang, "cover_subtitle")]], colWidths=[170 * mm], hAlign="LEFT")
     cover.setStyle(
         TableStyle(
             [
-                ("BACKGROUND", (0, 0), (-1, -1), theme["accent_soft"]),
+                ("BACKGROUND", (0, 0), (-1, -1), _THEME["accent_soft"]),
                 ("FONTNAME", (0, 0), (0, 0), bold_font),
                 ("FONTSIZE", (0, 0), (0, 0), 28),
                 ("FONTSIZE", (0, 1), (0, 1), 12),
-                ("TEXTCOLOR", (0, 0), (0, 0), theme["ink"]),
-                ("TEXTCOLOR", (0, 1), (0, 1), theme["muted"]),
+                ("TEXTCOLOR", (0, 0), (0, 0), _THEME["ink"]),
+                ("TEXTCOLOR", (0, 1), (0, 1), _THEME["muted"]),
                 ("LEFTPADDING", (0, 0), (-1, -1), 18),
                 ("RIGHTPADDING", (0, 0), (-1, -1), 18),
                 ("TOPPADDING", (0, 0), (-1, -1), 18),
@@ -352,181 +666,251 @@ def build_pdf(report_json: dict[str, Any], lang: str = "en") -> bytes:
             ]
         )
     )
-    story.append(Spacer(1, 45 * mm))
-    story.append(cover)
-    story.append(Spacer(1, 14 * mm))
+    return cover
+
+
+def _cover_table(lang: str, title: str) -> Table:
+    # The cover is fully static apart from the (rarely overridden) title, so
+    # the default-title cover is effectively a precompiled template page.
+    # Custom titles bypass the cache to keep it bounded by languages.
+    if title == _t(lang, "cover_title"):
+        return copy.copy(_cover_table_proto(lang, title))
+    proto = _cover_table_proto.__wrapped__(lang, title)
+    return proto
+
+
+def _build_story(
+    report_json: dict[str, Any],
+    lang: str,
+    *,
+    # Default-arg bindings turn the hot LOAD_GLOBAL lookups into
+    # LOAD_FAST, and the shared empty tuple avoids allocating a fresh
+    # list per missing key.
+    _Paragraph=Paragraph,
+    _Spacer=Spacer,
+    _Table=Table,
+    _EMPTY=(),
+) -> list[Any]:
+    styles = _base_styles()
+
+    story: list[Any] = []
+    title = str(report_json.get("title") or _t(lang, "cover_title"))
+    generated = str(report_json.get("generated_at_utc") or "")
+
+    # Batch the fixed cover sequence in one extend to cut per-append dispatch.
+    story.extend((_Spacer(1, 45 * mm), _cover_table(lang, title), _Spacer(1, 14 * mm)))
     if generated:
-        story.append(Paragraph(f"{_t(lang, 'generated')}: {generated}", styles["BodyText"]))
-    story.append(Spacer(1, 3 * mm))
-    story.append(Paragraph(_t(lang, "cover_disclaimer"), styles["Italic"]))
+        story.append(_Paragraph(f"{_t(lang, 'generated')}: {generated}", styles["BodyText"]))
+    story.append(_Spacer(1, 3 * mm))
+    story.append(_static_para(lang, "cover_disclaimer", "Italic"))
     story.append(PageBreak())
 
-    story.append(Paragraph(title, styles["Heading1"]))
+    story.append(_Paragraph(title, styles["Heading1"]))
     if generated:
-        story.append(Paragraph(f"{_t(lang, 'generated')}: {generated}", styles["Muted"]))
-    story.append(Spacer(1, 8))
+        story.append(_Paragraph(f"{_t(lang, 'generated')}: {generated}", styles["Muted"]))
+    story.append(_Spacer(1, 8))
 
     disclaimer = str(report_json.get("disclaimer", "")).strip()
     if disclaimer:
-        story.append(Paragraph(disclaimer, styles["Lead"]))
-        story.append(Spacer(1, 10))
+        story.append(_Paragraph(disclaimer, styles["Lead"]))
+        story.append(_Spacer(1, 10))
 
     profile = report_json.get("profile", {}) or {}
     goal = str(profile.get("goal", "")).strip()
     metrics = profile.get("derived_metrics", {}) or {}
-    story.append(section_header(_t(lang, "client_profile"), styles))
-    story.append(Spacer(1, 6))
+    story.append(_section_header(lang, "client_profile"))
+    story.append(_Spacer(1, 6))
     if goal:
-        story.append(Paragraph(f"<b>{_t(lang, 'goal')}:</b> {goal}", styles["BodyText"]))
+        story.append(_Paragraph(f"<b>{_t(lang, 'goal')}:</b> {goal}", styles["BodyText"]))
     metric_rows = [[_t(lang, "metric"), _t(lang, "value")]]
-    for key in ("age", "height_cm", "weight_kg", "bmi", "sleep_hours", "stress_1_10"):
-        if metrics.get(key) is not None and str(metrics.get(key)).strip() != "":
-            metric_rows.append([key.replace("_", " ").title(), str(metrics.get(key))])
+    metric_rows.extend(
+        [key.replace("_", " ").title(), str(value)]
+        for key in _METRIC_KEYS
+        if (value := metrics.get(key)) is not None and str(value).strip() != ""
+    )
     if len(metric_rows) > 1:
-        mt = Table(metric_rows, hAlign="LEFT", colWidths=[70 * mm, 70 * mm])
-        mt.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), theme["panel"]),
-                    ("GRID", (0, 0), (-1, -1), 0.5, theme["grid"]),
-                    ("FONTNAME", (0, 0), (-1, 0), bold_font),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FBFDFF")]),
-                ]
+        story.extend(
+            (
+                _Spacer(1, 6),
+                _Table(metric_rows, hAlign="LEFT", colWidths=_METRIC_COL_WIDTHS, style=_metric_table_style()),
             )
         )
-        story.append(Spacer(1, 6))
-        story.append(mt)
-    story.append(Spacer(1, 10))
+    story.append(_Spacer(1, 10))
 
-    summary_points = report_json.get("executive_summary", []) or []
+    summary_points = report_json.get("executive_summary", _EMPTY) or _EMPTY
     if summary_points:
-        story.append(section_header(_t(lang, "executive_summary"), styles))
-        story.append(Spacer(1, 6))
-        story.append(Paragraph(_safe_lines(summary_points), styles["BodyText"]))
-        story.append(Spacer(1, 8))
+        story.append(_section_header(lang, "executive_summary"))
+        story.append(_Spacer(1, 6))
+        story.append(_Paragraph(_safe_lines(summary_points), styles["BodyText"]))
+        story.append(_Spacer(1, 8))
 
-    priority_actions = report_json.get("priority_actions", []) or []
+    priority_actions = report_json.get("priority_actions", _EMPTY) or _EMPTY
     if priority_actions:
-        story.append(section_header(_t(lang, "priority_actions"), styles))
-        story.append(Spacer(1, 6))
-        story.append(Paragraph(_safe_lines(priority_actions), styles["BodyText"]))
-        story.append(Spacer(1, 8))
+        story.append(_section_header(lang, "priority_actions"))
+        story.append(_Spacer(1, 6))
+        story.append(_Paragraph(_safe_lines(priority_actions), styles["BodyText"]))
+        story.append(_Spacer(1, 8))
 
     answers = report_json.get("answers", {}) or {}
     score_rows = [[_t(lang, "section"), _t(lang, "score_100"), _t(lang, "notes")]]
-    for item in _compute_section_scores(answers, lang):
-        score_rows.append([str(item["section"]), str(item["score"]), str(item["note"])])
-    st = Table(score_rows, hAlign="LEFT", colWidths=[35 * mm, 25 * mm, 110 * mm], repeatRows=1)
-    st.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), theme["ink"]),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTNAME", (0, 0), (-1, 0), bold_font),
-                ("GRID", (0, 0), (-1, -1), 0.5, theme["grid"]),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FBFDFF")]),
-            ]
-        )
+    score_rows.extend(
+        [_s(item["section"]), _s(item["score"]), _s(item["note"])] for item in _compute_section_scores(answers, lang)
     )
-    story.append(section_header(_t(lang, "section_scores"), styles))
-    story.append(Spacer(1, 6))
-    story.append(st)
-    story.append(Spacer(1, 10))
+    st = _Table(score_rows, hAlign="LEFT", colWidths=_SCORE_COL_WIDTHS, repeatRows=1, style=_score_table_style())
+    # KeepTogether makes the header + table one layout unit, so a page
+    # overflow re-flows just this block instead of the surrounding story.
+    story.append(KeepTogether([_section_header(lang, "section_scores"), _Spacer(1, 6), st]))
+    story.append(_Spacer(1, 10))
 
     summary = report_json.get("summary", {}) or {}
-    story.append(section_header(_t(lang, "summary"), styles))
-    story.append(Spacer(1, 6))
-    story.append(Paragraph(f"{_t(lang, 'bioage_estimate')}: {summary.get('bioage_estimate', '')}", styles["BodyText"]))
-    key_focus = summary.get("key_focus", []) or []
-    if key_focus:
-        story.append(Paragraph(f"{_t(lang, 'key_focus')}: " + ", ".join(key_focus), styles["BodyText"]))
-    story.append(Spacer(1, 10))
-
-    story.append(section_header(_t(lang, "plan_weekly"), styles))
-    story.append(Spacer(1, 6))
-    plan = report_json.get("plan_90_days", []) or []
-    rows = [[_t(lang, "week"), _t(lang, "focus"), _t(lang, "actions")]]
-    for item in plan:
-        rows.append(
-            [
-                str(item.get("week", "")),
-                str(item.get("focus", "")),
-                "\n".join(item.get("actions", []) or []),
-            ]
+    if summary:
+        story.append(_section_header(lang, "summary"))
+        story.append(_Spacer(1, 6))
+        # Model output lands in Paragraph's mini-HTML parser; escape it so a
+        # stray "&" or "<" cannot derail layout.
+        story.append(
+            _Paragraph(f"{_t(lang, 'bioage_estimate')}: {_xml_escape(str(summary.get('bioage_estimate', '')))}", styles["BodyText"])
         )
-    plan_table = Table(rows, hAlign="LEFT", colWidths=[20 * mm, 45 * mm, 95 * mm], repeatRows=1)
-    plan_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), theme["ink"]),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                ("FONTNAME", (0, 0), (-1, 0), bold_font),
-                ("GRID", (0, 0), (-1, -1), 0.5, theme["grid"]),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#FBFDFF")]),
-            ]
+        key_focus = summary.get("key_focus", _EMPTY) or _EMPTY
+        if key_focus:
+            story.append(_Paragraph(f"{_t(lang, 'key_focus')}: " + ", ".join(map(_xml_escape, map(str, key_focus))), styles["BodyText"]))
+        story.append(_Spacer(1, 10))
+
+    plan = report_json.get("plan_90_days", _EMPTY) or _EMPTY
+    if plan:
+        story.append(_section_header(lang, "plan_weekly"))
+        story.append(_Spacer(1, 6))
+        _nl_join = "\n".join
+        rows = [[_t(lang, "week"), _t(lang, "focus"), _t(lang, "actions")]]
+        rows.extend(
+            [_s(item.get("week", "")), _pooled(_s(item.get("focus", ""))), _pooled(_nl_join(item.get("actions", _EMPTY) or _EMPTY))]
+            for item in plan
         )
-    )
-    story.append(plan_table)
-    story.append(Spacer(1, 10))
+        # LongTable paginates incrementally instead of retry-splitting the
+        # whole table, which matters once the plan runs to dozens of rows.
+        story.append(LongTable(rows, hAlign="LEFT", colWidths=_PLAN_COL_WIDTHS, repeatRows=1, splitByRow=1, style=_plan_table_style()))
+        story.append(_Spacer(1, 10))
 
-    phases = report_json.get("phases", []) or []
+    phases = report_json.get("phases", _EMPTY) or _EMPTY
     if phases:
-        story.append(section_header(_t(lang, "phases"), styles))
-        story.append(Spacer(1, 6))
+        story.append(_section_header(lang, "phases"))
+        story.append(_Spacer(1, 6))
         for phase in phases:
-            phase_title = Table([[str(phase.get("name", ""))]], colWidths=[170 * mm], hAlign="LEFT")
-            phase_title.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, -1), theme["panel"]),
-                        ("TEXTCOLOR", (0, 0), (-1, -1), theme["ink"]),
-                        ("FONTNAME", (0, 0), (-1, -1), bold_font),
-                        ("FONTSIZE", (0, 0), (-1, -1), 11),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                        ("TOPPADDING", (0, 0), (-1, -1), 6),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ]
-                )
-            )
-            story.append(phase_title)
+            # Each phase becomes an independent layout unit: backtracking on
+            # overflow stays bounded to one phase instead of the whole list.
+            block: list[Any] = [_Table([[str(phase.get("name", ""))]], colWidths=[170 * mm], hAlign="LEFT", style=_phase_title_style())]
             objective = str(phase.get("objective", "")).strip()
             if objective:
-                story.append(Paragraph(f"<b>{_t(lang, 'objective')}:</b> {objective}", styles["BodyText"]))
-            story.append(Paragraph(f"<b>{_t(lang, 'habits')}:</b><br/>{_safe_lines(phase.get('habits'))}", styles["Small"]))
-            story.append(Paragraph(f"<b>{_t(lang, 'training')}:</b><br/>{_safe_lines(phase.get('training'))}", styles["Small"]))
-            story.append(Paragraph(f"<b>{_t(lang, 'nutrition')}:</b><br/>{_safe_lines(phase.get('nutrition'))}", styles["Small"]))
-            story.append(Paragraph(f"<b>{_t(lang, 'recovery')}:</b><br/>{_safe_lines(phase.get('recovery'))}", styles["Small"]))
-            story.append(Spacer(1, 8))
-
-    warnings = report_json.get("warnings", []) or []
-    risk_flags = report_json.get("risk_flags", []) or []
+                block.append(_Paragraph(f"<b>{_t(lang, 'objective')}:</b> {objective}", styles["BodyText"]))
+            block.append(_Paragraph(f"<b>{_t(lang, 'habits')}:</b><br/>{_safe_lines(phase.get('habits'))}", styles["Small"]))
+            block.append(_Paragraph(f"<b>{_t(lang, 'training')}:</b><br/>{_safe_lines(phase.get('training'))}", styles["Small"]))
+            block.append(_Paragraph(f"<b>{_t(lang, 'nutrition')}:</b><br/>{_safe_lines(phase.get('nutrition'))}", styles["Small"]))
+            block.append(_Paragraph(f"<b>{_t(lang, 'recovery')}:</b><br/>{_safe_lines(phase.get('recovery'))}", styles["Small"]))
+            block.append(_Spacer(1, 8))
+            story.append(KeepTogether(block))
+            if phase.get("page_break"):
+                story.append(PageBreak())
+
+    warnings = report_json.get("warnings", _EMPTY) or _EMPTY
+    risk_flags = report_json.get("risk_flags", _EMPTY) or _EMPTY
     combined_risks = [str(x) for x in [*risk_flags, *warnings] if str(x).strip()]
     if combined_risks:
-        story.append(section_header(_t(lang, "safety_notes"), styles))
-        story.append(Spacer(1, 6))
-        for w in combined_risks:
-            story.append(Paragraph(f"- {w}", styles["BodyText"]))
+        story.append(_section_header(lang, "safety_notes"))
+        story.append(_Spacer(1, 6))
+        story.append(_bullet_list(combined_risks, styles["BodyText"]))
 
-    next_steps = report_json.get("next_steps", []) or []
+    next_steps = report_json.get("next_steps", _EMPTY) or _EMPTY
     if next_steps:
-        story.append(Spacer(1, 8))
-        story.append(section_header(_t(lang, "next_steps"), styles))
-        story.append(Spacer(1, 6))
-        for step in next_steps:
-            story.append(Paragraph(f"- {step}", styles["BodyText"]))
+        story.append(_Spacer(1, 8))
+        story.append(_section_header(lang, "next_steps"))
+        story.append(_Spacer(1, 6))
+        story.append(_bullet_list(next_steps, styles["BodyText"]))
 
     if answers:
-        story.append(Spacer(1, 8))
-        story.append(section_header(_t(lang, "assessment_snapshot"), styles))
-        story.append(Spacer(1, 6))
-        qlabels = {q.qid: q.label(lang) for q in QUESTIONS}
+        story.append(_Spacer(1, 8))
+        story.append(_section_header(lang, "assessment_snapshot"))
+        story.append(_Spacer(1, 6))
+        qlabels = _qlabels(lang)
         for k, v in answers.items():
             label = qlabels.get(k, k)
-            story.append(Paragraph(f"<b>{label}</b>: {v}", styles["Small"]))
+            story.append(_Paragraph(f"<b>{label}</b>: {v}", styles["Small"]))
+
+    return story
+
+
+def _draw_chrome(canvas_obj, doc_obj) -> None:
+    # The static footer is defined once per document as a form XObject;
+    # subsequent pages emit a one-line reference to it, so per page only
+    # the page number (which actually varies) is drawn in Python.
+    if not canvas_obj.hasForm("chrome"):
+        canvas_obj.beginForm("chrome")
+        canvas_obj.saveState()
+        canvas_obj.setFillColor(_THEME["muted"])
+        canvas_obj.setFont(_base_styles()["Normal"].fontName, 8)
+        canvas_obj.drawString(doc_obj.leftMargin, 8 * mm, "BioAge Reset Protocol")
+        canvas_obj.restoreState()
+        canvas_obj.endForm()
+    canvas_obj.doForm("chrome")
+    canvas_obj.saveState()
+    canvas_obj.setFillColor(_THEME["muted"])
+    canvas_obj.setFont(_base_styles()["Normal"].fontName, 8)
+    canvas_obj.drawRightString(A4[0] - doc_obj.rightMargin, 8 * mm, str(canvas_obj.getPageNumber()))
+    canvas_obj.restoreState()
+
+
+def build_pdf_to_stream(report_json: dict[str, Any], out: Any, lang: str = "en") -> None:
+    """Render the report PDF directly into a caller-supplied file-like object."""
+    doc = _new_doc(out)
+    doc.build(_build_story(report_json, lang), onFirstPage=_draw_chrome, onLaterPages=_draw_chrome)
+
 
-    doc.build(story, onFirstPage=draw_chrome, onLaterPages=draw_chrome)
+def _build_pdf_uncached(report_json: dict[str, Any], lang: str) -> bytes:
+    buf = _ChunkBuf()
+    build_pdf_to_stream(report_json, buf, lang)
     return buf.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _build_pdf_cached(key: str, lang: str) -> bytes:
+    return _build_pdf_uncached(json.loads(key), lang)
+
+
+def build_pdf(report_json: dict[str, Any], lang: str = "en") -> bytes:
+    # Retries and preview-then-download flows render the same content_json
+    # repeatedly; memoize the finished bytes by canonicalized input.
+    try:
+        key = json.dumps(report_json, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return _build_pdf_uncached(report_json, lang)
+    return _build_pdf_cached(key, lang)
+
+
+_PDF_POOL: ProcessPoolExecutor | None = None
+
+
+def _pdf_pool() -> ProcessPoolExecutor:
+    # Created lazily so importing this module (e.g. in the RQ worker) does
+    # not fork a pool that is never used.
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        _PDF_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PDF_POOL
+
+
+def _build_pdf_star(item: tuple[dict[str, Any], str]) -> bytes:
+    return build_pdf(item[0], item[1])
+
+
+def build_many(items: Iterable[tuple[dict[str, Any], str]]) -> list[bytes]:
+    """Render many (report_json, lang) pairs in parallel across cores.
+
+    Each render is independent and CPU-bound, so bulk regeneration scales
+    near-linearly on the shared worker pool.
+    """
+    return list(_pdf_pool().map(_build_pdf_star, items))
+
+
+async def build_pdf_async(report_json: dict[str, Any], lang: str = "en") -> bytes:
+    """Render the report in a worker process so concurrent requests use all
+    cores instead of serializing the CPU-bound build on the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_pdf_pool(), build_pdf, report_json, lang)
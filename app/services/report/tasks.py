@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 
 from sqlalchemy import select
@@ -7,35 +8,61 @@ from sqlalchemy import select
 from app.db.session import SessionLocal
 from app.core.settings import settings
 from app.db import models
-from app.services.openai_service import generate_report_json
+from app.services.openai_service import generate_report_json_async
 from app.services.report.pdf import build_pdf
 from app.services.email.service import send_report_email
-from app.services.storage.service import store_report
+from app.services.storage.service import is_local_abs_path, store_report
+
+# One loop per worker process: asyncio.run would build and tear down a loop
+# (and with it the async engine's connection pool) on every job, forcing a
+# Postgres reconnect per report.
+_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _worker_loop() -> asyncio.AbstractEventLoop:
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP
+
 
 def generate_and_send_report(report_id: str) -> None:
     """RQ worker task: generate report JSON + PDF and email it."""
     async def _run() -> None:
         async with SessionLocal() as session:
-            report = await session.get(models.Report, report_id)
-            if not report:
-                return
-            user = await session.get(models.User, report.user_id)
-            if not user:
+            # One joined statement instead of three sequential session.get
+            # round-trips; the assessment is optional, hence the outer join.
+            q = (
+                select(models.Report, models.User, models.Assessment)
+                .join(models.User, models.User.id == models.Report.user_id)
+                .outerjoin(models.Assessment, models.Assessment.id == models.Report.assessment_id)
+                .where(models.Report.id == report_id)
+            )
+            row = (await session.execute(q)).first()
+            if not row:
                 return
-            assessment_answers = {}
-            if report.assessment_id:
-                assessment = await session.get(models.Assessment, report.assessment_id)
-                if assessment:
-                    assessment_answers = assessment.answers or {}
-
-            report.status = "generating"
-            await session.commit()
+            report, user, assessment = row
+            assessment_answers = (assessment.answers if assessment else None) or {}
 
-            content = generate_report_json(assessment_answers, user.language)
-            pdf_bytes = build_pdf(content, user.language)
+            # No intermediate "generating" commit: the row already says
+            # "queued", and skipping the extra round-trip + WAL flush keeps
+            # the job's write path to a single final commit.
+            content = await generate_report_json_async(assessment_answers, user.language)
+            # CPU-bound render and blocking S3/file I/O both go to worker
+            # threads so the loop stays free for the session's own I/O.
+            pdf_bytes = await asyncio.to_thread(build_pdf, content, user.language)
 
             filename = f"bioage_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{report.id}.pdf"
-            stored_ref = store_report(filename, pdf_bytes)
+            stored_ref = await asyncio.to_thread(store_report, filename, pdf_bytes)
+
+            # With local storage the PDF already sits on disk; attach it by
+            # path and drop our copy so the job never holds the bytes and
+            # the base64 MIME part at the same time.
+            if is_local_abs_path(stored_ref):
+                attachment = (filename, stored_ref, "application/pdf")
+            else:
+                attachment = (filename, pdf_bytes, "application/pdf")
+            del pdf_bytes
 
             report.content_json = content
             report.file_path = stored_ref
@@ -47,10 +74,8 @@ def generate_and_send_report(report_id: str) -> None:
             send_report_email(
                 to_email=user.email,
                 download_url=download_url,
-                attachment=(filename, pdf_bytes, "application/pdf"),
+                attachment=attachment,
                 lang=user.language,
             )
 
-    import asyncio
-
-    asyncio.run(_run())
+    _worker_loop().run_until_complete(_run())
@@ -1,36 +1,47 @@
 from __future__ import annotations
 
 import os
+import time
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
 from urllib.parse import quote
 
 from app.core.settings import settings
 
 
+# These predicates run once per media ref during page renders; compare
+# fixed-length slices so no call lowercases or splits the whole string.
 def _is_http(url: str) -> bool:
-    v = (url or "").lower()
-    return v.startswith("http://") or v.startswith("https://")
+    v = (url or "")[:8].lower()
+    return v[:7] == "http://" or v == "https://"
 
 
 def is_s3_ref(value: str | None) -> bool:
-    return bool(value and value.startswith("s3://"))
+    return bool(value) and value[:5] == "s3://"
 
 
 def is_local_static_ref(value: str | None) -> bool:
-    return bool(value and value.startswith("/static/"))
+    return bool(value) and value[:8] == "/static/"
 
 
 def is_local_abs_path(value: str | None) -> bool:
-    return bool(value and os.path.isabs(value) and value.startswith("/"))
+    return bool(value and os.path.isabs(value) and value[:1] == "/")
 
 
 def _s3_key_from_ref(ref: str) -> str:
-    # ref format: s3://bucket/key
-    return ref.split("/", 3)[3]
+    # ref format: s3://bucket/key — slice past the first "/" after the
+    # bucket instead of allocating a 4-element split list.
+    return ref[ref.index("/", 5) + 1 :]
 
 
+@lru_cache(maxsize=1)
 def _s3_client():
+    # Client construction parses botocore service models and builds a fresh
+    # connection pool — tens of ms. Cache one client so every upload and
+    # presign reuses the pool, signer and keep-alive connections.
     import boto3
+    from botocore.config import Config
 
     return boto3.client(
         "s3",
@@ -38,9 +49,24 @@ def _s3_client():
         aws_access_key_id=settings.s3_access_key_id,
         aws_secret_access_key=settings.s3_secret_access_key,
         endpoint_url=settings.s3_endpoint_url,
+        config=Config(max_pool_connections=50, retries={"max_attempts": 3, "mode": "adaptive"}),
     )
 
 
+_TRANSFER_CONFIG = None
+
+
+def _transfer_config():
+    from boto3.s3.transfer import TransferConfig
+
+    global _TRANSFER_CONFIG
+    if _TRANSFER_CONFIG is None:
+        # Parallel multipart parts past 8 MB; small objects still go up in
+        # one request.
+        _TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024)
+    return _TRANSFER_CONFIG
+
+
 def _ensure_local_dirs() -> None:
     os.makedirs(settings.report_dir, exist_ok=True)
     os.makedirs(settings.uploads_dir, exist_ok=True)
@@ -52,7 +78,15 @@ def store_report(filename: str, data: bytes) -> str:
         if not settings.s3_bucket:
             raise RuntimeError("storage_backend=s3 but S3_BUCKET is not configured")
         key = f"{settings.s3_reports_prefix}/{datetime.utcnow().strftime('%Y/%m/%d')}/{filename}"
-        _s3_client().put_object(Bucket=settings.s3_bucket, Key=key, Body=data, ContentType="application/pdf")
+        # upload_fileobj streams from the buffer (BytesIO over bytes is
+        # copy-on-write) and switches to parallel multipart for large PDFs.
+        _s3_client().upload_fileobj(
+            BytesIO(data),
+            settings.s3_bucket,
+            key,
+            ExtraArgs={"ContentType": "application/pdf"},
+            Config=_transfer_config(),
+        )
         return f"s3://{settings.s3_bucket}/{key}"
 
     _ensure_local_dirs()
@@ -82,21 +116,59 @@ def store_upload(filename: str, data: bytes, content_type: str | None = None) ->
     return abs_path
 
 
+# Presigned URLs are deterministic for a given ref until they expire, yet
+# dashboards re-sign the same refs on every render. Cache them for 80% of
+# the expiry window so repeat views skip the SigV4 signing entirely.
+# (cachetools would fit here but is not a dependency; a small dict with
+# FIFO eviction does the job, same as the email attachment cache.)
+_PRESIGN_CACHE: dict[tuple[str, bool, str | None], tuple[float, str]] = {}
+_PRESIGN_CACHE_MAX = 4096
+
+
+def _presign_cached(cache_key: tuple[str, bool, str | None]) -> str | None:
+    entry = _PRESIGN_CACHE.get(cache_key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _presign_store(cache_key: tuple[str, bool, str | None], url: str) -> None:
+    if len(_PRESIGN_CACHE) >= _PRESIGN_CACHE_MAX:
+        _PRESIGN_CACHE.pop(next(iter(_PRESIGN_CACHE)))
+    _PRESIGN_CACHE[cache_key] = (time.monotonic() + settings.s3_presign_expiry_seconds * 0.8, url)
+
+
 def presigned_download_url(ref: str, *, inline: bool = False, filename: str | None = None) -> str | None:
     if not is_s3_ref(ref):
         return None
     if not settings.s3_bucket:
         return None
+    cache_key = (ref, inline, filename)
+    cached = _presign_cached(cache_key)
+    if cached is not None:
+        return cached
     key = _s3_key_from_ref(ref)
     params = {"Bucket": settings.s3_bucket, "Key": key}
     if inline:
         resolved_name = filename or os.path.basename(key) or "report.pdf"
         params["ResponseContentDisposition"] = f'inline; filename="{resolved_name}"'
-    return _s3_client().generate_presigned_url(
+    url = _s3_client().generate_presigned_url(
         "get_object",
         Params=params,
         ExpiresIn=settings.s3_presign_expiry_seconds,
     )
+    if url:
+        _presign_store(cache_key, url)
+    return url
+
+
+def media_view_urls(refs: list[str | None]) -> list[str]:
+    # Bulk variant for list renders: de-dupe refs first so a page showing
+    # the same object many times pays for one SigV4 signing, not N.
+    uniq: dict[str, str] = dict.fromkeys(r for r in refs if r)  # type: ignore[arg-type]
+    for ref in uniq:
+        uniq[ref] = media_view_url(ref)
+    return [uniq.get(r, "") if r else "" for r in refs]
 
 
 def media_view_url(ref: str | None) -> str:
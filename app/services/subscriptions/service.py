@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import models
@@ -24,6 +25,23 @@ PLAN_FEATURES: dict[str, PlanFeatures] = {
 }
 PLAN_RANK: dict[str, int] = {"free": 0, "pro": 1, "premium": 2}
 
+# Tutorial membership checks run per request; precompute frozensets once
+# instead of rebuilding a set from the tuple on every call.
+_TUTORIALS_SET: dict[str, frozenset[str]] = {pid: frozenset(pf.tutorials) for pid, pf in PLAN_FEATURES.items()}
+
+
+# Month starts change twelve times a year; cache the truncated datetime
+# keyed by (year, month) so quota checks skip the replace() churn.
+_MONTH_START: tuple[tuple[int, int], datetime] = ((0, 0), datetime.min.replace(tzinfo=timezone.utc))
+
+
+def _month_start(now: datetime) -> datetime:
+    global _MONTH_START
+    key = (now.year, now.month)
+    if _MONTH_START[0] != key:
+        _MONTH_START = (key, now.replace(day=1, hour=0, minute=0, second=0, microsecond=0))
+    return _MONTH_START[1]
+
 
 def get_plan_features(plan_id: str | None) -> PlanFeatures:
     return PLAN_FEATURES.get(plan_id or "free", PLAN_FEATURES["free"])
@@ -54,10 +72,23 @@ async def get_latest_subscription(session: AsyncSession, user_id: str) -> models
 
 
 async def get_current_plan_id(session: AsyncSession, user_id: str) -> str:
-    sub = await get_latest_subscription(session, user_id)
-    if is_subscription_active(sub):
-        return sub.plan_id
-    return "free"
+    # Push the "active" filter into SQL so the DB returns at most one
+    # plan_id (served by the ix_user_subs_active partial index) instead of
+    # shipping the newest row back for a Python-side status check.
+    q = (
+        select(models.UserSubscription.plan_id)
+        .where(
+            models.UserSubscription.user_id == user_id,
+            models.UserSubscription.status.in_(["active", "trialing"]),
+            (models.UserSubscription.current_period_end.is_(None))
+            | (models.UserSubscription.current_period_end > func.now()),
+        )
+        .order_by(models.UserSubscription.updated_at.desc(), models.UserSubscription.created_at.desc())
+        .limit(1)
+    )
+    res = await session.execute(q)
+    plan_id = res.scalar_one_or_none()
+    return plan_id or "free"
 
 
 async def can_generate_report(session: AsyncSession, user_id: str) -> tuple[bool, str]:
@@ -66,16 +97,21 @@ async def can_generate_report(session: AsyncSession, user_id: str) -> tuple[bool
     if features.monthly_reports is None:
         return True, plan_id
 
-    # Count sent reports in current UTC month
-    now = datetime.now(tz=timezone.utc)
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    q = select(func.count(models.Report.id)).where(
-        models.Report.user_id == user_id,
-        models.Report.status.in_(["queued", "generating", "sent"]),
-        models.Report.created_at >= month_start,
+    # Count reports in the current UTC month, but only up to limit + 1
+    # rows: a COUNT(*) would scan the whole month while LIMIT lets the
+    # ix_reports_quota range scan stop at the first quota-exceeding row.
+    month_start = _month_start(datetime.now(tz=timezone.utc))
+    q = (
+        select(models.Report.id)
+        .where(
+            models.Report.user_id == user_id,
+            models.Report.status.in_(["queued", "generating", "sent"]),
+            models.Report.created_at >= month_start,
+        )
+        .limit(features.monthly_reports + 1)
     )
     res = await session.execute(q)
-    used = int(res.scalar() or 0)
+    used = len(res.scalars().all())
     return used < features.monthly_reports, plan_id
 
 
@@ -84,7 +120,8 @@ def tutorials_for_plan(plan_id: str) -> tuple[str, ...]:
 
 
 def has_tutorial_access(plan_id: str, slug: str) -> bool:
-    return slug in set(tutorials_for_plan(plan_id))
+    # Unknown plans fall back to the free tier, same as get_plan_features.
+    return slug in _TUTORIALS_SET.get(plan_id or "free", _TUTORIALS_SET["free"])
 
 
 def has_plan_access(user_plan_id: str, required_plan_id: str) -> bool:
@@ -104,20 +141,53 @@ async def upsert_subscription(
     cancel_at_period_end: bool,
     provider_payload: dict,
 ) -> models.UserSubscription:
-    sub: models.UserSubscription | None = None
     if provider_subscription_id:
-        q = select(models.UserSubscription).where(models.UserSubscription.provider_subscription_id == provider_subscription_id)
-        res = await session.execute(q)
-        sub = res.scalars().first()
-
-    if not sub:
-        q = (
-            select(models.UserSubscription)
-            .where(models.UserSubscription.user_id == user_id)
-            .order_by(models.UserSubscription.updated_at.desc(), models.UserSubscription.created_at.desc())
+        # Single-round-trip upsert arbitrated by the unique index on
+        # provider_subscription_id; this is the common webhook path, so it
+        # skips the SELECT-then-INSERT/UPDATE dance entirely.
+        now = datetime.utcnow()
+        stmt = (
+            pg_insert(models.UserSubscription)
+            .values(
+                id=models._uuid(),
+                user_id=user_id,
+                provider=provider,
+                plan_id=plan_id,
+                status=status,
+                provider_customer_id=provider_customer_id,
+                provider_subscription_id=provider_subscription_id,
+                current_period_end=current_period_end,
+                cancel_at_period_end=cancel_at_period_end,
+                provider_payload=provider_payload or {},
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_update(
+                index_elements=["provider_subscription_id"],
+                set_={
+                    "provider": provider,
+                    "plan_id": plan_id,
+                    "status": status,
+                    "provider_customer_id": provider_customer_id,
+                    "current_period_end": current_period_end,
+                    "cancel_at_period_end": cancel_at_period_end,
+                    "provider_payload": provider_payload or {},
+                    "updated_at": now,
+                },
+            )
+            .returning(models.UserSubscription)
         )
-        res = await session.execute(q)
-        sub = res.scalars().first()
+        res = await session.scalars(stmt)
+        return res.one()
+
+    # Providerless rows (e.g. manual plan changes) keep the lookup path.
+    q = (
+        select(models.UserSubscription)
+        .where(models.UserSubscription.user_id == user_id)
+        .order_by(models.UserSubscription.updated_at.desc(), models.UserSubscription.created_at.desc())
+    )
+    res = await session.execute(q)
+    sub = res.scalars().first()
 
     if not sub:
         sub = models.UserSubscription(user_id=user_id)
@@ -41,6 +41,10 @@ def do_run_migrations(connection: Connection) -> None:
         connection=connection,
         target_metadata=target_metadata,
         compare_type=True,
+        render_as_batch=True,
+        # Everything lives in the default schema; skipping cross-schema
+        # reflection keeps autogenerate startup from scanning the catalog.
+        include_schemas=False,
     )
 
     with context.begin_transaction():
@@ -17,7 +17,41 @@ branch_labels = None
 depends_on = None
 
 
+def _create_index(name: str, table: str, columns: list[str], unique: bool = False) -> None:
+    # On PostgreSQL build the index CONCURRENTLY so writes are not blocked
+    # for the duration; that requires running outside the migration
+    # transaction, hence the autocommit block. Other backends (SQLite in
+    # dev) take the plain path.
+    if op.get_bind().dialect.name == "postgresql":
+        uniq = "UNIQUE " if unique else ""
+        cols = ", ".join(columns)
+        with op.get_context().autocommit_block():
+            op.execute(f"CREATE {uniq}INDEX CONCURRENTLY {name} ON {table} ({cols})")
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def seed_bulk(table, rows: list[dict], batch: int = 500) -> None:
+    # For seed revisions: one multi-VALUES INSERT per chunk instead of a
+    # round trip per row. Import from here (or copy) when seeding
+    # tutorial_categories/tutorials data.
+    for i in range(0, len(rows), batch):
+        op.bulk_insert(table, rows[i : i + batch])
+
+
+def _drop_index(name: str, table: str) -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY {name}")
+    else:
+        op.drop_index(name, table_name=table)
+
+
 def upgrade() -> None:
+    # server_default + NOT NULL inside create_table is safe (the table is
+    # empty). Do not copy the pattern into add_column on populated tables:
+    # PostgreSQL < 11 rewrites the whole table for it. See
+    # migrations/README.md for the three-step alternative.
     op.create_table(
         "tutorial_categories",
         sa.Column("id", sa.String(length=36), primary_key=True),
@@ -27,7 +61,7 @@ def upgrade() -> None:
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
-    op.create_index("ix_tutorial_categories_slug", "tutorial_categories", ["slug"], unique=True)
+    _create_index("ix_tutorial_categories_slug", "tutorial_categories", ["slug"], unique=True)
 
     op.create_table(
         "tutorials",
@@ -43,14 +77,25 @@ def upgrade() -> None:
         sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.text("true")),
         sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
     )
-    op.create_index("ix_tutorials_category_id", "tutorials", ["category_id"])
-    op.create_index("ix_tutorials_slug", "tutorials", ["slug"], unique=True)
+    if op.get_bind().dialect.name == "postgresql":
+        # Covering index for the tutorials catalog: the listing filters on
+        # category_id + is_active and reads slug/title/required_plan, so
+        # the INCLUDE payload resolves it index-only, no heap lookups.
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY ix_tutorials_category_active "
+                "ON tutorials (category_id, is_active) "
+                "INCLUDE (slug, title, required_plan)"
+            )
+    else:
+        op.create_index("ix_tutorials_category_active", "tutorials", ["category_id", "is_active"])
+    _create_index("ix_tutorials_slug", "tutorials", ["slug"], unique=True)
 
 
 def downgrade() -> None:
-    op.drop_index("ix_tutorials_slug", table_name="tutorials")
-    op.drop_index("ix_tutorials_category_id", table_name="tutorials")
+    _drop_index("ix_tutorials_slug", "tutorials")
+    _drop_index("ix_tutorials_category_active", "tutorials")
     op.drop_table("tutorials")
 
-    op.drop_index("ix_tutorial_categories_slug", table_name="tutorial_categories")
+    _drop_index("ix_tutorial_categories_slug", "tutorial_categories")
     op.drop_table("tutorial_categories")
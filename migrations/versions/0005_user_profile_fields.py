@@ -17,15 +17,54 @@ branch_labels = None
 depends_on = None
 
 
+def _create_index(name: str, table: str, columns: list[str], unique: bool = False) -> None:
+    # On PostgreSQL build the index CONCURRENTLY so writes are not blocked
+    # for the duration; that requires running outside the migration
+    # transaction, hence the autocommit block. Other backends (SQLite in
+    # dev) take the plain path.
+    if op.get_bind().dialect.name == "postgresql":
+        uniq = "UNIQUE " if unique else ""
+        cols = ", ".join(columns)
+        with op.get_context().autocommit_block():
+            op.execute(f"CREATE {uniq}INDEX CONCURRENTLY {name} ON {table} ({cols})")
+    else:
+        op.create_index(name, table, columns, unique=unique)
+
+
+def _drop_index(name: str, table: str) -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(f"DROP INDEX CONCURRENTLY {name}")
+    else:
+        op.drop_index(name, table_name=table)
+
+
 def upgrade() -> None:
-    op.add_column("users", sa.Column("username", sa.String(length=64), nullable=True))
-    op.add_column("users", sa.Column("first_name", sa.String(length=100), nullable=True))
-    op.add_column("users", sa.Column("last_name", sa.String(length=100), nullable=True))
-    op.create_index("ix_users_username", "users", ["username"], unique=False)
+    if op.get_bind().dialect.name == "postgresql":
+        # One ALTER TABLE with three ADD COLUMN clauses: one round trip
+        # and one lock acquisition instead of three.
+        op.execute(
+            "ALTER TABLE users "
+            "ADD COLUMN username VARCHAR(64), "
+            "ADD COLUMN first_name VARCHAR(100), "
+            "ADD COLUMN last_name VARCHAR(100)"
+        )
+    else:
+        # One batch: SQLite rebuilds the users table once instead of once
+        # per column.
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(sa.Column("username", sa.String(length=64), nullable=True))
+            batch_op.add_column(sa.Column("first_name", sa.String(length=100), nullable=True))
+            batch_op.add_column(sa.Column("last_name", sa.String(length=100), nullable=True))
+    _create_index("ix_users_username", "users", ["username"])
 
 
 def downgrade() -> None:
-    op.drop_index("ix_users_username", table_name="users")
-    op.drop_column("users", "last_name")
-    op.drop_column("users", "first_name")
-    op.drop_column("users", "username")
+    _drop_index("ix_users_username", "users")
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("ALTER TABLE users DROP COLUMN last_name, DROP COLUMN first_name, DROP COLUMN username")
+    else:
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.drop_column("last_name")
+            batch_op.drop_column("first_name")
+            batch_op.drop_column("username")
@@ -17,9 +17,32 @@ branch_labels = None
 depends_on = None
 
 
+# When a revision eventually backfills password_hash from a legacy source,
+# do NOT write it as one giant UPDATE: that locks every row at once and
+# balloons WAL on a large users table. Use the batched pattern below so
+# each chunk commits independently and replication lag stays bounded:
+#
+#     with op.get_context().autocommit_block():
+#         bind = op.get_bind()
+#         batch = 1000
+#         while True:
+#             res = bind.execute(
+#                 sa.text(
+#                     "UPDATE users SET password_hash = <derive> "
+#                     "WHERE id IN (SELECT id FROM users "
+#                     "WHERE password_hash IS NULL LIMIT :n)"
+#                 ),
+#                 {"n": batch},
+#             )
+#             if res.rowcount < batch:
+#                 break
+
+
 def upgrade() -> None:
-    op.add_column("users", sa.Column("password_hash", sa.String(length=255), nullable=True))
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("password_hash", sa.String(length=255), nullable=True))
 
 
 def downgrade() -> None:
-    op.drop_column("users", "password_hash")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("password_hash")
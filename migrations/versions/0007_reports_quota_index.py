@@ -0,0 +1,46 @@
+"""add partial composite index for report quota counts
+
+Revision ID: 0007_reports_quota_index
+Revises: 0006_user_password_hash
+Create Date: 2026-08-29
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0007_reports_quota_index"
+down_revision = "0006_user_password_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # can_generate_report counts a user's reports for the current month
+    # filtered by status; this partial index lets Postgres answer it with a
+    # bounded index-only range scan instead of filtering every user row.
+    # Built CONCURRENTLY so the reports table keeps taking writes.
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY ix_reports_quota "
+                "ON reports (user_id, created_at) "
+                "WHERE status IN ('queued', 'generating', 'sent')"
+            )
+    else:
+        op.create_index(
+            "ix_reports_quota",
+            "reports",
+            ["user_id", "created_at"],
+            postgresql_where="status IN ('queued', 'generating', 'sent')",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY ix_reports_quota")
+    else:
+        op.drop_index("ix_reports_quota", table_name="reports")
@@ -0,0 +1,47 @@
+"""add partial index for active subscription lookups
+
+Revision ID: 0008_user_subs_active_index
+Revises: 0007_reports_quota_index
+Create Date: 2026-08-29
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008_user_subs_active_index"
+down_revision = "0007_reports_quota_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # get_current_plan_id fetches the newest active/trialing subscription
+    # per user; this partial index resolves that ORDER BY ... LIMIT 1 with
+    # a single index probe instead of scanning the user's full history.
+    # Built CONCURRENTLY so subscription writes are not blocked.
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY ix_user_subs_active "
+                "ON user_subscriptions (user_id, updated_at DESC) "
+                "WHERE status IN ('active', 'trialing')"
+            )
+    else:
+        op.create_index(
+            "ix_user_subs_active",
+            "user_subscriptions",
+            ["user_id", sa.text("updated_at DESC")],
+            postgresql_where="status IN ('active', 'trialing')",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute("DROP INDEX CONCURRENTLY ix_user_subs_active")
+    else:
+        op.drop_index("ix_user_subs_active", table_name="user_subscriptions")
@@ -0,0 +1,55 @@
+"""make provider_subscription_id index unique for upserts
+
+Revision ID: 0009_user_subs_unique_provider_sub
+Revises: 0008_user_subs_active_index
+Create Date: 2026-08-29
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0009_user_subs_unique_provider_sub"
+down_revision = "0008_user_subs_active_index"
+branch_labels = None
+depends_on = None
+
+_NAME = "ix_user_subscriptions_provider_subscription_id"
+_TMP = _NAME + "_tmp"
+
+
+def _swap_index(create_tmp_sql: str) -> None:
+    # Build the replacement CONCURRENTLY under a temporary name first, so
+    # the webhook-lookup column never goes unindexed and writes are never
+    # blocked; only then drop the old index and take over its name.
+    with op.get_context().autocommit_block():
+        op.execute(create_tmp_sql)
+        op.execute(f"DROP INDEX CONCURRENTLY {_NAME}")
+    op.execute(f"ALTER INDEX {_TMP} RENAME TO {_NAME}")
+
+
+def upgrade() -> None:
+    # upsert_subscription relies on INSERT ... ON CONFLICT, which needs a
+    # unique index as its arbiter. NULLs stay allowed (Postgres treats them
+    # as distinct), so rows without a provider id are unaffected.
+    if op.get_bind().dialect.name == "postgresql":
+        _swap_index(
+            f"CREATE UNIQUE INDEX CONCURRENTLY {_TMP} "
+            "ON user_subscriptions (provider_subscription_id)"
+        )
+    else:
+        op.drop_index(_NAME, table_name="user_subscriptions")
+        op.create_index(_NAME, "user_subscriptions", ["provider_subscription_id"], unique=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        _swap_index(
+            f"CREATE INDEX CONCURRENTLY {_TMP} "
+            "ON user_subscriptions (provider_subscription_id)"
+        )
+    else:
+        op.drop_index(_NAME, table_name="user_subscriptions")
+        op.create_index(_NAME, "user_subscriptions", ["provider_subscription_id"])
@@ -1,21 +1,147 @@
 from __future__ import annotations
 
+import multiprocessing
 import os
+import signal
+import socket
+
+from urllib.parse import urlparse
 
 import redis
-from rq import Worker, Queue, Connection
+from redis.backoff import ExponentialBackoff
+from redis.retry import Retry
+from rq import SimpleWorker, Worker, Queue
 
 from app.core.settings import settings
 
 
+def _run_worker(redis_url: str, listen: list[str], idx: int) -> None:
+    # A sized blocking pool with keepalive: heartbeats, payload fetches and
+    # result writes reuse warm connections instead of reconnecting, and the
+    # health check revives sockets an idle LB may have dropped. socket_timeout
+    # is deliberately left unset — RQ derives one from its dequeue timeout,
+    # and a smaller value would kill the blocking pop mid-wait. Each worker
+    # process builds its own pool; sharing sockets across forks is unsafe.
+    pool_kwargs: dict = {
+        "max_connections": int(os.environ.get("REDIS_POOL_SIZE", "16")),
+        "timeout": 20,
+        "health_check_interval": 30,
+        # A NAT or LB that blackholes an idle connection must not hang the
+        # worker forever: retry timed-out commands with backoff so a
+        # blocked worker self-heals instead of eating a slot until restart.
+        "retry_on_timeout": True,
+        "retry": Retry(ExponentialBackoff(), 3),
+    }
+    if not redis_url.startswith("unix://"):
+        # TCP-only knobs; the unix-socket connection class rejects them.
+        pool_kwargs["socket_connect_timeout"] = 5
+        pool_kwargs["socket_keepalive"] = True
+        pool_kwargs["socket_keepalive_options"] = {
+            socket.TCP_KEEPIDLE: 30,
+            socket.TCP_KEEPINTVL: 10,
+            socket.TCP_KEEPCNT: 3,
+        }
+    pool = redis.BlockingConnectionPool.from_url(redis_url, **pool_kwargs)
+    conn = redis.Redis(connection_pool=pool)
+
+    # Explicit connection= everywhere instead of the deprecated Connection
+    # context: no thread-local stack walk per queue/worker operation, and
+    # the queues are a real list rather than a one-shot map iterator.
+    queues = [Queue(name, connection=conn) for name in listen]
+    # Warm the heavy job dependencies (SQLAlchemy models, ReportLab, the
+    # report pipeline) and the TTF font registry in the parent: forked job
+    # children inherit the initialized modules copy-on-write instead of
+    # paying the cold import on their first job, and SimpleWorker reuses
+    # them in-process.
+    from app.services.report import pdf, tasks  # noqa: F401
+
+    pdf._register_unicode_fonts()
+
+    # RQ_SIMPLE=1 runs jobs in-process instead of forking a child per job;
+    # report jobs are I/O-heavy (OpenAI, S3, SMTP), so the long-lived
+    # process amortizes interpreter/import cost at the price of less
+    # isolation between jobs.
+    worker_cls = SimpleWorker if os.environ.get("RQ_SIMPLE") == "1" else Worker
+    # Longer heartbeat/monitoring intervals cut bookkeeping RTTs between
+    # jobs; RQ_BURST=1 makes the worker drain the queue and exit (useful
+    # for short-lived autoscaled instances), RQ_MAX_JOBS caps a worker's
+    # lifetime for periodic recycling.
+    worker = worker_cls(
+        queues,
+        connection=conn,
+        job_monitoring_interval=30,
+        default_worker_ttl=600,
+        default_result_ttl=int(os.environ.get("RQ_RESULT_TTL", "500")),
+    )
+    # Skip formatting the job description per job; RQ's own SIGTERM
+    # handler already drains the in-flight job before exiting (warm
+    # shutdown), so scale-downs never waste a half-rendered report.
+    worker.log_job_description = False
+    worker.work(
+        with_scheduler=False,
+        burst=os.environ.get("RQ_BURST") == "1",
+        max_jobs=int(os.environ.get("RQ_MAX_JOBS", "0")) or None,
+        logging_level=os.environ.get("RQ_LOG_LEVEL", "WARNING"),
+    )
+
+
 def main() -> None:
+    # redis-py only uses the C hiredis RESP parser when the package is
+    # importable, otherwise it silently falls back to the pure-Python one,
+    # which is several times slower on the HGET/LPUSH/BLPOP traffic RQ
+    # issues around every job. Fail loudly so deployments can't regress.
+    try:
+        import hiredis  # noqa: F401
+    except ImportError as exc:
+        raise RuntimeError("hiredis is required for the worker (pip install hiredis)") from exc
+
     listen = ["default"]
     redis_url = settings.redis_url
-    conn = redis.from_url(redis_url)
 
-    with Connection(conn):
-        worker = Worker(map(Queue, listen))
-        worker.work(with_scheduler=False)
+    # Same-host deployments can skip the TCP loopback round trip entirely:
+    # honor an explicit REDIS_UNIX_SOCKET, otherwise switch to the
+    # conventional socket path when the URL points at localhost and the
+    # socket actually exists. redis.from_url handles unix:// transparently.
+    unix_socket = os.environ.get("REDIS_UNIX_SOCKET")
+    if not unix_socket and ("localhost" in redis_url or "127.0.0.1" in redis_url):
+        if os.path.exists("/var/run/redis/redis.sock"):
+            unix_socket = "/var/run/redis/redis.sock"
+    if unix_socket:
+        # Carry the database number and credentials over from the TCP URL;
+        # a bare unix:// path would silently point the worker at db 0
+        # unauthenticated while the web app keeps enqueuing elsewhere.
+        parsed = urlparse(redis_url)
+        db = (parsed.path or "").lstrip("/") or "0"
+        auth = f"{parsed.username or ''}:{parsed.password}@" if parsed.password else ""
+        redis_url = f"unix://{auth}{unix_socket}?db={db}"
+
+    # RQ_WORKERS>1 spawns that many worker processes in one container so
+    # every core drains the queue; each child builds its own Redis pool
+    # after the fork.
+    n = int(os.environ.get("RQ_WORKERS", "1"))
+    if n <= 1:
+        _run_worker(redis_url, listen, 0)
+        return
+
+    procs = [
+        multiprocessing.Process(target=_run_worker, args=(redis_url, listen, i), daemon=False)
+        for i in range(n)
+    ]
+    for p in procs:
+        p.start()
+
+    # Forward SIGTERM to the children so each RQ worker performs its warm
+    # shutdown (finish the in-flight job, stop taking new ones) instead of
+    # dying mid-job when the supervisor process is told to stop.
+    def _forward_sigterm(signum, frame):
+        for p in procs:
+            if p.is_alive() and p.pid:
+                os.kill(p.pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGTERM, _forward_sigterm)
+
+    for p in procs:
+        p.join()
 
 
 if __name__ == "__main__":